@@ -3,24 +3,30 @@
 from .config import (
     async_session_factory,
     get_session_factory,
+    get_read_session_factory,
     Base,
     get_db_session,
     init_db,
     close_db,
     is_db_available,
-    DATABASE_URL
+    DATABASE_URL,
+    DB_BACKGROUND_SAVES,
+    DB_SAVE_DEBOUNCE
 )
 from .models import GameSession, GameStatus, GameMode, GameMove, ActionType
 
 __all__ = [
     "async_session_factory",
     "get_session_factory",
+    "get_read_session_factory",
     "Base",
     "get_db_session",
     "init_db",
     "close_db",
     "is_db_available",
     "DATABASE_URL",
+    "DB_BACKGROUND_SAVES",
+    "DB_SAVE_DEBOUNCE",
     "GameSession",
     "GameStatus",
     "GameMode",
@@ -3,8 +3,8 @@ Database Models
 SQLAlchemy 모델 정의
 """
 
-from datetime import datetime
-from sqlalchemy import Column, String, DateTime, Boolean, Integer, Enum as SQLEnum, ForeignKey
+from sqlalchemy import Column, String, DateTime, Boolean, Integer, SmallInteger, LargeBinary, ForeignKey, Index, text, func
+from sqlalchemy.types import TypeDecorator
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 import enum
@@ -12,6 +12,37 @@ import enum
 from .config import Base
 
 
+def utc_now():
+    """DB 서버 현재 시각 (UTC, timezone 없는 DateTime 컬럼용)"""
+    return func.timezone("utc", func.now())
+
+
+class EnumAsInt(TypeDecorator):
+    """
+    Enum을 SMALLINT로 저장 (정의 순서의 인덱스 사용)
+
+    DB에는 정의 순서 인덱스가 저장되므로 Enum 멤버는 끝에만 추가하고 순서를 바꾸지 않는다
+    """
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, enum_cls: type[enum.Enum]):
+        super().__init__()
+        self.enum_cls = enum_cls
+        self._members = list(enum_cls)
+        self._indexes = {member: index for index, member in enumerate(self._members)}
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return self._indexes[value]
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return self._members[value]
+
+
 class GameStatus(enum.Enum):
     """게임 상태"""
     IN_PROGRESS = "in_progress"
@@ -31,21 +62,30 @@ class GameSession(Base):
     게임 세션 테이블
 
     게임의 전체 상태를 JSONB로 저장하여 유연하게 관리
-    game_history는 모든 수의 기록을 배열로 저장하여 리플레이 기능 지원
+    수 기록은 game_moves 테이블(GameMove)에 저장하여 리플레이 기능 지원
     """
     __tablename__ = "game_sessions"
+    __table_args__ = (
+        # 진행 중 세션 목록(get_active_sessions) 키셋 페이지네이션용 부분 인덱스 (status 0 = IN_PROGRESS)
+        Index(
+            "ix_game_sessions_active",
+            "updated_at",
+            "game_id",
+            postgresql_where=text("status = 0 AND is_deleted = false")
+        ),
+    )
 
     # 기본 키: 게임 ID (UUID 문자열)
     game_id = Column(String(36), primary_key=True, index=True)
 
     # 게임 메타 정보
     status = Column(
-        SQLEnum(GameStatus, name="game_status"),
+        EnumAsInt(GameStatus),
         default=GameStatus.IN_PROGRESS,
         nullable=False
     )
     game_mode = Column(
-        SQLEnum(GameMode, name="game_mode"),
+        EnumAsInt(GameMode),
         default=GameMode.VS_AI,
         nullable=False
     )
@@ -66,19 +106,22 @@ class GameSession(Base):
     # 포함 내용: board, players (positions, walls_remaining), walls
     game_state = Column(JSONB, nullable=False)
 
-    # 게임 히스토리 (리플레이용 - 모든 수의 기록)
-    # 배열 형태: [{"turn": 1, "player": 1, "action": {...}, "timestamp": "..."}, ...]
-    game_history = Column(JSONB, nullable=False, default=list)
-
     # 타임스탬프
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=utc_now(), nullable=False)
+    updated_at = Column(DateTime, server_default=utc_now(), onupdate=utc_now(), nullable=False)
 
     # 삭제 여부 (소프트 삭제)
     is_deleted = Column(Boolean, default=False, nullable=False)
 
+    # INSERT 시 서버 기본값(타임스탬프)을 RETURNING으로 함께 가져옴
+    __mapper_args__ = {"eager_defaults": True}
+
     # 관계: 게임 히스토리 (1:N)
-    moves = relationship("GameMove", back_populates="game_session", order_by="GameMove.step_no")
+    moves = relationship(
+        "GameMove",
+        back_populates="game_session",
+        order_by="[GameMove.step_no, GameMove.id]"
+    )
 
     def __repr__(self):
         return f"<GameSession(game_id={self.game_id}, status={self.status.value})>"
@@ -97,9 +140,21 @@ class GameMove(Base):
     각 이동/벽 설치를 개별 레코드로 저장하여 리플레이 기능 지원
     """
     __tablename__ = "game_moves"
+    __table_args__ = (
+        # 리플레이 조회용 복합 인덱스 (game_id 필터 + step_no 정렬/조회)
+        # 승리 수는 턴이 넘어가지 않아 직전 수와 step_no가 같을 수 있으므로 unique 아님
+        Index("ix_game_moves_game_step", "game_id", "step_no"),
+        # 키프레임(스냅샷 보유 수) 조회용 부분 인덱스
+        Index(
+            "ix_game_moves_keyframe",
+            "game_id",
+            "step_no",
+            postgresql_where=text("game_state_snapshot IS NOT NULL")
+        ),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    game_id = Column(String(36), ForeignKey("game_sessions.game_id"), nullable=False, index=True)
+    game_id = Column(String(36), ForeignKey("game_sessions.game_id"), nullable=False)
 
     # 수 번호 (0부터 시작, 순서대로 증가)
     step_no = Column(Integer, nullable=False)
@@ -108,16 +163,21 @@ class GameMove(Base):
     player = Column(Integer, nullable=False)  # 1 또는 2
 
     # 액션 정보
-    action_type = Column(SQLEnum(ActionType, name="action_type"), nullable=False)
+    action_type = Column(EnumAsInt(ActionType), nullable=False)
     row = Column(Integer, nullable=False)
     col = Column(Integer, nullable=False)
     orientation = Column(String(20), nullable=True)  # wall일 때만 사용
 
     # 이 수를 둔 후의 게임 상태 스냅샷 (리플레이용)
-    game_state_snapshot = Column(JSONB, nullable=False)
+    # 키프레임(SNAPSHOT_INTERVAL 배수 스텝, 게임 종료 수)에만 저장하고 나머지는 NULL
+    # 중간 상태는 가장 가까운 키프레임부터 수를 재생하여 복원
+    # GameSerializer.state_to_bits로 압축한 바이트 (최대 29바이트) (이름 등 메타데이터는 game_sessions에서 가져옴)
+    game_state_snapshot = Column(LargeBinary, nullable=True)
 
     # 타임스탬프
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at = Column(DateTime, server_default=utc_now(), nullable=False)
+
+    __mapper_args__ = {"eager_defaults": True}
 
     # 관계
     game_session = relationship("GameSession", back_populates="moves")
@@ -138,3 +198,20 @@ class GameMove(Base):
         if self.orientation:
             result["orientation"] = self.orientation
         return result
+
+    def to_history_entry(self) -> dict:
+        """히스토리 항목 형식으로 변환 ({"turn", "player", "action", "timestamp"})"""
+        action = {
+            "type": self.action_type.value,
+            "player": self.player,
+            "row": self.row,
+            "col": self.col
+        }
+        if self.orientation:
+            action["orientation"] = self.orientation
+        return {
+            "turn": self.step_no,
+            "player": self.player,
+            "action": action,
+            "timestamp": self.created_at.isoformat() + "Z"
+        }
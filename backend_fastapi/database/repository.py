@@ -5,11 +5,22 @@ Game Session Repository
 
 from datetime import datetime
 from typing import Optional
-from sqlalchemy import select, update
+from sqlalchemy import select, insert, update, delete, func, tuple_, values, column, cast, true
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from games.game_Quoridor.serializers import GameSerializer
 
 from .models import GameSession, GameStatus, GameMode, GameMove, ActionType
 
+# 스냅샷(키프레임) 저장 간격 - 이 배수의 스텝과 게임 종료 수에만 전체 상태 저장
+SNAPSHOT_INTERVAL = 20
+
+# 문자열 -> Enum 변환 테이블 (쓰기 경로에서 Enum 값 탐색 생략)
+_GAME_MODES = {mode.value: mode for mode in GameMode}
+_GAME_STATUSES = {status.value: status for status in GameStatus}
+_ACTION_TYPES = {action_type.value: action_type for action_type in ActionType}
+
 
 class GameSessionRepository:
     """게임 세션 저장소"""
@@ -26,95 +37,182 @@ class GameSessionRepository:
         ai_difficulty: Optional[str],
         game_state: dict
     ) -> GameSession:
-        """새 게임 세션 생성"""
-        game_session = GameSession(
-            game_id=game_id,
-            player1_name=player1_name,
-            player2_name=player2_name,
-            game_mode=GameMode(game_mode),
-            ai_difficulty=ai_difficulty if game_mode == "vs_ai" else None,
-            game_state=game_state,
-            game_history=[],
-            status=GameStatus.IN_PROGRESS,
-            current_turn=1,
-            turn_count=0
-        )
-        self.session.add(game_session)
+        """새 게임 세션 생성 (INSERT ... RETURNING으로 서버 기본값까지 한 번에 조회)"""
+        result = await self.session.execute(
+            insert(GameSession)
+            .values(
+                game_id=game_id,
+                player1_name=player1_name,
+                player2_name=player2_name,
+                game_mode=_GAME_MODES[game_mode],
+                ai_difficulty=ai_difficulty if game_mode == "vs_ai" else None,
+                game_state=game_state,
+                status=GameStatus.IN_PROGRESS,
+                current_turn=1,
+                turn_count=0
+            )
+            .returning(GameSession)
+        )
+        game_session = result.scalar_one()
         await self.session.commit()
-        await self.session.refresh(game_session)
         return game_session
 
     async def get_by_id(self, game_id: str) -> Optional[GameSession]:
-        """게임 ID로 세션 조회"""
+        """게임 ID로 세션 조회 (같은 세션에서 이미 로드된 행은 identity map에서 반환)"""
+        game_session = await self.session.get(GameSession, game_id)
+        if game_session is None or game_session.is_deleted:
+            return None
+        return game_session
+
+    async def get_by_id_with_moves(self, game_id: str) -> Optional[GameSession]:
+        """게임 ID로 세션 조회 (수 기록까지 함께 로드 - 리플레이용)"""
         result = await self.session.execute(
-            select(GameSession).where(
+            select(GameSession)
+            .options(selectinload(GameSession.moves))
+            .where(
                 GameSession.game_id == game_id,
                 GameSession.is_deleted == False
             )
         )
         return result.scalar_one_or_none()
 
-    async def update_game_state(
+    async def is_finished(self, game_id: str) -> bool:
+        """승패가 결정된 게임인지 확인 (상태 컬럼만 조회)"""
+        status = await self.session.scalar(
+            select(GameSession.status).where(
+                GameSession.game_id == game_id,
+                GameSession.is_deleted == False
+            )
+        )
+        return status in (GameStatus.PLAYER1_WIN, GameStatus.PLAYER2_WIN)
+
+    async def get_version(self, game_id: str) -> Optional[tuple[int, str]]:
+        """게임의 (turn_count, status) 조회 (상태 컬럼만 조회 - 변경 여부 판단용)"""
+        row = (await self.session.execute(
+            select(GameSession.turn_count, GameSession.status).where(
+                GameSession.game_id == game_id,
+                GameSession.is_deleted == False
+            )
+        )).first()
+        if row is None:
+            return None
+        return row.turn_count, row.status.value
+
+    async def update_game_state_with_moves(
         self,
         game_id: str,
         game_state: dict,
-        action: Optional[dict] = None,
-        status: Optional[str] = None,
-        winner: Optional[int] = None
-    ) -> Optional[GameSession]:
+        status: Optional[str],
+        winner: Optional[int],
+        moves: list[dict]
+    ) -> bool:
         """
-        게임 상태 업데이트
+        게임 상태 업데이트 + 수 기록 추가 (커밋하지 않음 - 호출자가 커밋)
+
+        UPDATE ... RETURNING을 CTE로 두고 수 기록은 INSERT ... SELECT ... FROM updated로 추가해
+        한 문장(DB 왕복 1회)으로 실행 (세션 행이 없거나 삭제된 경우 수 기록도 추가되지 않음)
 
         Args:
             game_id: 게임 ID
             game_state: 새 게임 상태
-            action: 수행된 액션 (히스토리에 추가)
             status: 게임 상태 (in_progress, finished)
             winner: 승자 (1 또는 2)
+            moves: _move_values 인자와 같은 키를 가진 딕셔너리 목록 (순서대로)
+
+        Returns:
+            세션 행이 업데이트되었는지 여부
         """
-        game_session = await self.get_by_id(game_id)
-        if not game_session:
-            return None
+        stmt = (
+            self._update_state_stmt(game_id, game_state, status, winner)
+            .returning(GameSession.game_id)
+        )
+        if not moves:
+            result = await self.session.execute(stmt)
+            return result.first() is not None
 
-        # 게임 상태 업데이트
-        game_session.game_state = game_state
-        game_session.current_turn = game_state.get("current_turn", 1)
-        game_session.turn_count = game_state.get("turn_count", 0)
-        game_session.updated_at = datetime.utcnow()
+        updated = stmt.cte("updated")
+        move_columns = [
+            "step_no", "player", "action_type", "row", "col", "orientation", "game_state_snapshot"
+        ]
+        new_moves = values(
+            *(column(name, GameMove.__table__.c[name].type) for name in move_columns),
+            name="new_moves"
+        ).data([
+            tuple(move_values[name] for name in move_columns)
+            for move_values in (self._move_values(**move) for move in moves)
+        ])
+        result = await self.session.execute(
+            insert(GameMove)
+            .from_select(
+                ["game_id", *move_columns],
+                select(
+                    updated.c.game_id,
+                    # VALUES 열 타입은 첫 행 값으로 추론되므로(NULL 스냅샷 -> text) 테이블 열 타입으로 캐스팅
+                    *(cast(new_moves.c[name], GameMove.__table__.c[name].type) for name in move_columns)
+                )
+                .select_from(updated)
+                .join(new_moves, true())
+            )
+            .add_cte(updated)
+            .returning(GameMove.id)
+        )
+        return result.first() is not None
+
+    @staticmethod
+    def _update_state_stmt(
+        game_id: str,
+        game_state: dict,
+        status: Optional[str],
+        winner: Optional[int]
+    ):
+        """게임 상태 UPDATE 문 구성"""
+        values = {
+            "game_state": game_state,
+            "current_turn": game_state.get("current_turn", 1),
+            "turn_count": game_state.get("turn_count", 0)
+        }
 
         # 상태 업데이트
         if status:
-            game_session.status = GameStatus(status)
+            values["status"] = _GAME_STATUSES[status]
 
         # 승자 업데이트
         if winner is not None:
-            game_session.winner = winner
-
-        # 액션을 히스토리에 추가
-        if action:
-            history_entry = {
-                "turn": game_session.turn_count,
-                "player": action.get("player", game_session.current_turn),
-                "action": action,
-                "timestamp": datetime.utcnow().isoformat() + "Z"
-            }
-            # JSONB 배열에 추가 (기존 히스토리 복사 후 추가)
-            current_history = game_session.game_history or []
-            game_session.game_history = current_history + [history_entry]
+            values["winner"] = winner
 
-        await self.session.commit()
-        await self.session.refresh(game_session)
-        return game_session
-
-    async def get_active_sessions(self, limit: int = 50) -> list[GameSession]:
-        """진행 중인 게임 세션 목록 조회"""
-        result = await self.session.execute(
-            select(GameSession)
+        return (
+            update(GameSession)
             .where(
-                GameSession.status == GameStatus.IN_PROGRESS,
+                GameSession.game_id == game_id,
                 GameSession.is_deleted == False
             )
-            .order_by(GameSession.updated_at.desc())
+            .values(**values)
+        )
+
+    async def get_active_sessions(
+        self,
+        limit: int = 50,
+        before: Optional[tuple[datetime, str]] = None
+    ) -> list[GameSession]:
+        """
+        진행 중인 게임 세션 목록 조회 (updated_at, game_id 내림차순)
+
+        Args:
+            limit: 최대 조회 수
+            before: 키셋 커서 (updated_at, game_id) - 이 세션보다 오래된 것만 조회
+        """
+        query = select(GameSession).where(
+            GameSession.status == GameStatus.IN_PROGRESS,
+            GameSession.is_deleted == False
+        )
+        if before is not None:
+            query = query.where(
+                tuple_(GameSession.updated_at, GameSession.game_id) < tuple_(*before)
+            )
+
+        result = await self.session.execute(
+            query
+            .order_by(GameSession.updated_at.desc(), GameSession.game_id.desc())
             .limit(limit)
         )
         return list(result.scalars().all())
@@ -136,38 +234,45 @@ class GameSessionRepository:
 
     async def abandon_game(self, game_id: str) -> bool:
         """게임 포기 (기록은 보존, 활성 목록에서만 제외)"""
-        game_session = await self.get_by_id(game_id)
-        if not game_session:
-            return False
-
-        game_session.status = GameStatus.ABANDONED
-        game_session.updated_at = datetime.utcnow()
+        result = await self.session.execute(
+            update(GameSession)
+            .where(
+                GameSession.game_id == game_id,
+                GameSession.is_deleted == False
+            )
+            .values(status=GameStatus.ABANDONED)
+            .returning(GameSession.game_id)
+        )
+        updated = result.scalar_one_or_none() is not None
         await self.session.commit()
-        return True
+        return updated
 
     async def hard_delete(self, game_id: str) -> bool:
         """게임 완전 삭제 (기록도 숨김)"""
-        game_session = await self.get_by_id(game_id)
-        if not game_session:
-            return False
-
-        game_session.status = GameStatus.ABANDONED
-        game_session.is_deleted = True
-        game_session.updated_at = datetime.utcnow()
+        result = await self.session.execute(
+            update(GameSession)
+            .where(
+                GameSession.game_id == game_id,
+                GameSession.is_deleted == False
+            )
+            .values(status=GameStatus.ABANDONED, is_deleted=True)
+            .returning(GameSession.game_id)
+        )
+        updated = result.scalar_one_or_none() is not None
         await self.session.commit()
-        return True
+        return updated
 
     async def get_game_history(self, game_id: str) -> Optional[list]:
-        """게임 히스토리 조회 (리플레이용) - 기존 JSONB 방식"""
-        game_session = await self.get_by_id(game_id)
+        """게임 히스토리 조회 (리플레이용) - game_moves 테이블에서 구성"""
+        game_session = await self.get_by_id_with_moves(game_id)
         if not game_session:
             return None
-        return game_session.game_history
+        return [move.to_history_entry() for move in game_session.moves]
 
     # ===== GameMove 관련 메서드 (리플레이 시스템) =====
 
-    async def add_move(
-        self,
+    @staticmethod
+    def _move_values(
         game_id: str,
         step_no: int,
         player: int,
@@ -176,29 +281,31 @@ class GameSessionRepository:
         col: int,
         orientation: Optional[str],
         game_state_snapshot: dict
-    ) -> GameMove:
-        """새로운 수 기록 추가"""
-        move = GameMove(
+    ) -> dict:
+        """GameMove 컬럼 값 구성 (키프레임에만 압축 스냅샷 포함)"""
+        is_keyframe = (
+            step_no % SNAPSHOT_INTERVAL == 0
+            or game_state_snapshot.get("status") != "in_progress"
+        )
+        return dict(
             game_id=game_id,
             step_no=step_no,
             player=player,
-            action_type=ActionType(action_type),
+            action_type=_ACTION_TYPES[action_type],
             row=row,
             col=col,
             orientation=orientation,
-            game_state_snapshot=game_state_snapshot
+            game_state_snapshot=(
+                GameSerializer.state_to_bits(game_state_snapshot) if is_keyframe else None
+            )
         )
-        self.session.add(move)
-        await self.session.commit()
-        await self.session.refresh(move)
-        return move
 
     async def get_moves(self, game_id: str) -> list[GameMove]:
         """게임의 모든 수 조회 (step_no 순서)"""
         result = await self.session.execute(
             select(GameMove)
             .where(GameMove.game_id == game_id)
-            .order_by(GameMove.step_no)
+            .order_by(GameMove.step_no, GameMove.id)
         )
         return list(result.scalars().all())
 
@@ -210,42 +317,53 @@ class GameSessionRepository:
         )
         return result.scalar_one_or_none()
 
-    async def get_state_at_step(self, game_id: str, step_no: int) -> Optional[dict]:
-        """특정 스텝에서의 게임 상태 스냅샷 조회"""
-        if step_no < 0:
-            # step 0 이전은 초기 상태 (게임 세션에서 조회)
-            game_session = await self.get_by_id(game_id)
-            if not game_session:
-                return None
-            # 초기 상태 반환 (첫 번째 move가 있으면 그 전 상태, 없으면 현재 상태)
-            moves = await self.get_moves(game_id)
-            if not moves:
-                return game_session.game_state
-            # 초기 상태는 별도로 저장하지 않았으므로 None 반환
-            return None
+    async def get_keyframe_at_or_before(self, game_id: str, step_no: int) -> Optional[GameMove]:
+        """특정 스텝 이하에서 가장 최근의 스냅샷 보유 수(키프레임) 조회"""
+        result = await self.session.execute(
+            select(GameMove)
+            .where(
+                GameMove.game_id == game_id,
+                GameMove.step_no <= step_no,
+                GameMove.game_state_snapshot.isnot(None)
+            )
+            .order_by(GameMove.step_no.desc(), GameMove.id.desc())
+            .limit(1)
+        )
+        return result.scalar_one_or_none()
 
-        move = await self.get_move_at_step(game_id, step_no)
-        if not move:
-            return None
-        return move.game_state_snapshot
+    async def get_moves_after(
+        self,
+        game_id: str,
+        after: Optional[GameMove],
+        up_to_step: int
+    ) -> list[GameMove]:
+        """기준 수(after) 이후부터 up_to_step까지의 수 조회 (after가 None이면 처음부터)"""
+        query = select(GameMove).where(
+            GameMove.game_id == game_id,
+            GameMove.step_no <= up_to_step
+        )
+        if after is not None:
+            query = query.where(
+                tuple_(GameMove.step_no, GameMove.id) > tuple_(after.step_no, after.id)
+            )
+        result = await self.session.execute(
+            query.order_by(GameMove.step_no, GameMove.id)
+        )
+        return list(result.scalars().all())
 
     async def get_total_moves(self, game_id: str) -> int:
         """게임의 총 수 개수"""
         result = await self.session.execute(
-            select(GameMove)
+            select(func.count(GameMove.id))
             .where(GameMove.game_id == game_id)
         )
-        return len(list(result.scalars().all()))
+        return result.scalar_one()
 
     async def delete_moves_after(self, game_id: str, step_no: int) -> int:
         """특정 스텝 이후의 수 삭제 (되돌리기용)"""
         result = await self.session.execute(
-            select(GameMove)
+            delete(GameMove)
             .where(GameMove.game_id == game_id, GameMove.step_no > step_no)
         )
-        moves = list(result.scalars().all())
-        count = len(moves)
-        for move in moves:
-            await self.session.delete(move)
         await self.session.commit()
-        return count
+        return result.rowcount
@@ -0,0 +1,92 @@
+"""
+Logging Configuration
+이벤트 루프를 막지 않는 로깅 (QueueHandler + 백그라운드 스레드 QueueListener)
+"""
+
+import logging
+import os
+import queue
+import time
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+# 로그 레벨 (DEBUG, INFO, WARNING, ...)
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+
+# 같은 로그 메시지(포맷 문자열 기준)를 초당 최대 몇 번까지 출력할지 (0이면 제한 없음)
+# DB 장애처럼 요청마다 같은 경고가 나는 상황에서 로그 폭주 방지
+LOG_RATE_LIMIT = int(os.getenv("LOG_RATE_LIMIT", "10"))
+
+LOG_FORMAT = "%(asctime)s %(levelname)s %(name)s: %(message)s"
+
+
+class RateLimitFilter(logging.Filter):
+    """같은 위치/포맷의 로그를 1초 구간마다 최대 limit개만 통과 (나머지는 버린 개수만 다음 로그에 표시)"""
+
+    def __init__(self, limit: int):
+        super().__init__()
+        self.limit = limit
+        # (로거 이름, 포맷 문자열) -> [구간 시작 시각, 통과 수, 버린 수]
+        self._windows: dict[tuple[str, str], list] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if self.limit <= 0:
+            return True
+
+        key = (record.name, str(record.msg))
+        now = time.monotonic()
+        window = self._windows.get(key)
+        if window is None or now - window[0] >= 1.0:
+            dropped = window[2] if window else 0
+            self._windows[key] = [now, 1, 0]
+            if dropped:
+                record.msg = f"{record.msg} (이전 1초간 {dropped}건 생략)"
+            return True
+
+        if window[1] < self.limit:
+            window[1] += 1
+            return True
+
+        window[2] += 1
+        return False
+
+
+_listener: Optional[QueueListener] = None
+_queue_handler: Optional[QueueHandler] = None
+
+
+def start_logging() -> None:
+    """
+    루트 로거에 QueueHandler 연결 후 출력 스레드 시작 (애플리케이션 시작 시)
+
+    로그 호출 측은 큐에 넣기만 하고 stderr 출력은 리스너 스레드에서 처리
+    """
+    global _listener, _queue_handler
+    if _listener is not None:
+        return
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _queue_handler = QueueHandler(log_queue)
+    _queue_handler.addFilter(RateLimitFilter(LOG_RATE_LIMIT))
+
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
+    root = logging.getLogger()
+    root.setLevel(LOG_LEVEL)
+    root.addHandler(_queue_handler)
+
+    _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+
+
+def stop_logging() -> None:
+    """남은 로그를 모두 출력하고 리스너 스레드 종료 (애플리케이션 종료 시)"""
+    global _listener, _queue_handler
+    if _listener is None:
+        return
+
+    logging.getLogger().removeHandler(_queue_handler)
+    _listener.stop()
+    _listener = None
+    _queue_handler = None
@@ -3,39 +3,53 @@ Game Project Backend - FastAPI
 Phase 1: 기본 인프라 및 API 설정
 """
 
+import logging
+import os
 import sys
-from pathlib import Path
 from contextlib import asynccontextmanager
 
-# 프로젝트 루트를 path에 추가 (games 패키지 접근용)
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+# 프로젝트 루트를 path에 추가 (games 패키지 접근용, 진입 모듈에서 한 번만)
+# python main.py 실행 시 __main__과 main으로 두 번 임포트되므로 중복 추가 방지
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from log_config import start_logging, stop_logging
+from responses import ORJSONResponse
 from routers.quoridor import router as quoridor_router
 from database import init_db, close_db
+from services.quoridor_service import quoridor_service
+
+logger = logging.getLogger(__name__)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """애플리케이션 생명주기 관리"""
-    # 시작: 데이터베이스 초기화
-    print("Initializing database...")
+    # 시작: 로깅 스레드 시작 후 데이터베이스 초기화
+    start_logging()
+    logger.info("Initializing database...")
     await init_db()
-    print("Database initialized successfully")
+    await quoridor_service.warm_up()
+    logger.info("Database initialized successfully")
     yield
-    # 종료: 데이터베이스 연결 정리
-    print("Closing database connections...")
+    # 종료: AI 프로세스 풀 정리, 대기 중인 게임 저장 후 데이터베이스 연결 정리, 남은 로그 출력
+    quoridor_service.shutdown()
+    await quoridor_service.flush_saves()
+    logger.info("Closing database connections...")
     await close_db()
-    print("Database connections closed")
+    logger.info("Database connections closed")
+    stop_logging()
 
 
 app = FastAPI(
     title="Game Project API",
     description="게임 허브 백엔드 API - 유저 관리, 게임 정보, 점수 기록",
     version="0.1.0",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -46,6 +60,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag"],  # 웹 클라이언트가 조건부 요청(If-None-Match)에 사용
 )
 
 
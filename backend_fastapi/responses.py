@@ -0,0 +1,19 @@
+"""
+Response Classes
+orjson 기반 JSON 응답
+"""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+# naive datetime은 UTC로 간주하고 "...Z" 형식으로 출력 (기존 isoformat() + "Z"와 같은 문자열)
+ORJSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z
+
+
+class ORJSONResponse(JSONResponse):
+    """orjson으로 직렬화하는 JSON 응답 (기본 응답 클래스)"""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=ORJSON_OPTIONS)
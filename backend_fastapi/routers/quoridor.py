@@ -3,7 +3,9 @@ Quoridor API Router
 쿼리도 게임 REST API 엔드포인트
 """
 
-from fastapi import APIRouter, HTTPException, status, Query
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, status, Query, Request, Response
 
 from schemas.quoridor import (
     CreateGameRequest,
@@ -21,12 +23,25 @@ from schemas.quoridor import (
     ReplayStateResponse,
 )
 from services.quoridor_service import quoridor_service
+from responses import ORJSONResponse
 
 router = APIRouter(
     prefix="/api/v1/quoridor",
     tags=["quoridor"],
 )
 
+# 게임 진행 중 자주 호출되는 엔드포인트의 성공 응답은 이미 구조화된 dict를
+# ORJSONResponse로 바로 반환 (response_model은 문서화용, Response 반환 시 재검증 생략)
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """If-None-Match 헤더가 ETag와 일치하는지 확인"""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or etag in tags
+
 
 @router.get(
     "/sessions",
@@ -34,10 +49,25 @@ router = APIRouter(
     summary="진행 중인 게임 세션 목록",
     description="DB에 저장된 진행 중인 게임 세션 목록을 조회합니다.",
 )
-async def get_active_sessions(limit: int = Query(default=50, ge=1, le=100)):
-    """진행 중인 게임 세션 목록 조회"""
-    sessions = await quoridor_service.get_active_sessions(limit=limit)
-    return ActiveSessionsResponse(sessions=sessions, count=len(sessions))
+async def get_active_sessions(
+    limit: int = Query(default=50, ge=1, le=100),
+    cursor: Optional[str] = Query(default=None, description="이전 응답의 next_page_token"),
+):
+    """진행 중인 게임 세션 목록 조회 (updated_at 내림차순 커서 페이지네이션)"""
+    try:
+        sessions, next_page_token = await quoridor_service.get_active_sessions(
+            limit=limit, cursor=cursor
+        )
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={"error": "invalid_cursor", "message": "Invalid page cursor"}
+        )
+    return ORJSONResponse({
+        "sessions": sessions,
+        "count": len(sessions),
+        "next_page_token": next_page_token
+    })
 
 
 @router.post(
@@ -71,16 +101,21 @@ async def create_game(request: CreateGameRequest = CreateGameRequest()):
     summary="게임 상태 조회",
     description="현재 게임 상태를 조회합니다. 메모리에 없으면 DB에서 자동 복구합니다.",
 )
-async def get_game(game_id: str):
-    """게임 상태 조회"""
-    game = await quoridor_service.get_game(game_id)
-    if not game:
+async def get_game(game_id: str, request: Request):
+    """게임 상태 조회 (If-None-Match가 현재 ETag와 같으면 304)"""
+    game_state = await quoridor_service.get_game_dict(game_id)
+    if game_state is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail={"error": "game_not_found", "message": "Game not found"}
         )
 
-    return game.to_dict()
+    # 수 기록은 되돌릴 수 없으므로 (turn_count, status)로 상태가 결정됨 (DB 재로드 후에도 동일)
+    etag = f'W/"{game_id}:{game_state["turn_count"]}:{game_state["status"]}"'
+    if _etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+    return ORJSONResponse(game_state, headers={"ETag": etag})
 
 
 @router.post(
@@ -107,8 +142,21 @@ async def recover_game(game_id: str):
     summary="게임 히스토리 조회",
     description="리플레이를 위한 게임의 모든 수 기록을 조회합니다.",
 )
-async def get_game_history(game_id: str):
-    """게임 히스토리 조회"""
+async def get_game_history(game_id: str, request: Request, response: Response):
+    """게임 히스토리 조회 (If-None-Match가 현재 ETag와 같으면 히스토리를 읽지 않고 304)"""
+    version = await quoridor_service.get_history_version(game_id)
+    if version is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={"error": "game_not_found", "message": "Game not found"}
+        )
+
+    # 수 기록은 되돌릴 수 없으므로 (turn_count, status)로 히스토리가 결정됨 (get_game과 같은 방식)
+    turn_count, game_status = version
+    etag = f'W/"{game_id}:history:{turn_count}:{game_status}"'
+    if _etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
     history = await quoridor_service.get_game_history(game_id)
     if history is None:
         raise HTTPException(
@@ -116,6 +164,7 @@ async def get_game_history(game_id: str):
             detail={"error": "game_not_found", "message": "Game not found"}
         )
 
+    response.headers["ETag"] = etag
     return GameHistoryResponse(game_id=game_id, history=history, total_moves=len(history))
 
 
@@ -143,11 +192,12 @@ async def move_pawn(game_id: str, request: MoveRequest):
             error="invalid_move"
         )
 
-    return ActionResponse(
-        success=True,
-        game_state=game.to_dict(),
-        message=message
-    )
+    return ORJSONResponse({
+        "success": True,
+        "game_state": game.to_dict(),
+        "message": message,
+        "error": None
+    })
 
 
 @router.post(
@@ -184,11 +234,12 @@ async def place_wall(game_id: str, request: WallRequest):
             error=error_code
         )
 
-    return ActionResponse(
-        success=True,
-        game_state=game.to_dict(),
-        message=message
-    )
+    return ORJSONResponse({
+        "success": True,
+        "game_state": game.to_dict(),
+        "message": message,
+        "error": None
+    })
 
 
 @router.post(
@@ -213,12 +264,13 @@ async def ai_move(game_id: str):
             error="ai_error"
         )
 
-    return AIActionResponse(
-        success=True,
-        action=action,
-        game_state=game.to_dict(),
-        message=message
-    )
+    return ORJSONResponse({
+        "success": True,
+        "action": {"orientation": None, **action},
+        "game_state": game.to_dict(),
+        "message": message,
+        "error": None
+    })
 
 
 @router.get(
@@ -236,7 +288,7 @@ async def get_valid_moves(game_id: str):
             detail={"error": "game_not_found", "message": "Game not found"}
         )
 
-    return ValidMovesResponse(**result)
+    return ORJSONResponse(result)
 
 
 @router.post(
@@ -3,6 +3,7 @@ Quoridor API Schemas
 Pydantic 모델 정의
 """
 
+from datetime import datetime
 from typing import Optional, Literal
 from pydantic import BaseModel, Field
 
@@ -131,14 +132,17 @@ class SessionInfoSchema(BaseModel):
     game_mode: Literal["vs_ai", "local_2p"]
     current_turn: int
     turn_count: int
-    created_at: str
-    updated_at: str
+    created_at: datetime
+    updated_at: datetime
 
 
 class ActiveSessionsResponse(BaseModel):
     """진행 중인 세션 목록 응답"""
     sessions: list[SessionInfoSchema]
     count: int
+    next_page_token: Optional[str] = Field(
+        default=None, description="다음 페이지 조회용 커서 (마지막 페이지면 null)"
+    )
 
 
 class HistoryEntrySchema(BaseModel):
@@ -0,0 +1,58 @@
+"""
+LRU Cache
+크기 제한이 있는 메모리 캐시
+"""
+
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+
+class LRUCache:
+    """최근 사용 순서 기반 캐시 (maxsize 초과 시 가장 오래 사용하지 않은 항목 제거)"""
+
+    def __init__(
+        self,
+        maxsize: int = 256,
+        on_evict: Optional[Callable[[Hashable, Any], None]] = None
+    ):
+        """
+        Args:
+            maxsize: 최대 항목 수
+            on_evict: 크기 초과로 항목이 제거될 때 호출할 함수 (key, value)
+        """
+        self.maxsize = maxsize
+        self.on_evict = on_evict
+        self._data: OrderedDict = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """항목 조회 (조회된 항목은 최근 사용으로 갱신)"""
+        if key not in self._data:
+            return default
+        self._data.move_to_end(key)
+        return self._data[key]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """항목 저장"""
+        self._data[key] = value
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            evicted_key, evicted_value = self._data.popitem(last=False)
+            if self.on_evict:
+                self.on_evict(evicted_key, evicted_value)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """항목 제거 후 반환"""
+        return self._data.pop(key, default)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def values(self) -> list:
+        """저장된 값 목록 (최근 사용 순서에 영향 없음)"""
+        return list(self._data.values())
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
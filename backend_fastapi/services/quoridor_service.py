@@ -3,40 +3,125 @@ Quoridor Service
 게임 비즈니스 로직 (DB 연동)
 """
 
-import sys
-from pathlib import Path
+import asyncio
+import base64
+import binascii
+import logging
+import multiprocessing
+import os
+import time
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
+from itertools import islice
 from typing import Optional
 
-# games 패키지 경로 추가
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
-
-from games.__init__ import *
-
-# 게임 로직 임포트
-from games import GameState, Wall
-from games.game_Quoridor.core.board import Position
-from games.game_Quoridor.core.wall import Orientation
-from games.game_Quoridor.ai.simple_ai import SimpleAI
+# 게임 로직 임포트 (games 패키지 경로는 main.py에서 추가)
+from games.game_Quoridor.core.game_state import ActionType, FINISHED_STATUSES, GameState, GameStatus
+from games.game_Quoridor.ai.simple_ai import SimpleAI, search_from_snapshot
+from games.game_Quoridor.serializers.game_serializer import GameSerializer, MoveRecord
 
 # DB 관련 임포트
-from database import get_session_factory, is_db_available
+from database import (
+    DB_BACKGROUND_SAVES,
+    DB_SAVE_DEBOUNCE,
+    GameMode,
+    get_read_session_factory,
+    get_session_factory,
+    is_db_available
+)
 from database.repository import GameSessionRepository
 
+from .cache import LRUCache
+
+logger = logging.getLogger(__name__)
+
+# 메모리에 유지할 최대 게임 수 (초과 시 가장 오래 사용하지 않은 게임을 메모리에서 제거, DB에서 재로드)
+MAX_HOT_GAMES = int(os.getenv("MAX_HOT_GAMES", "10000"))
+
+# 종료된 게임의 리플레이 데이터 캐시 최대 게임 수
+REPLAY_CACHE_SIZE = 256
+
+# 유효 이동 목록 캐시 최대 게임 수
+VALID_MOVES_CACHE_SIZE = 1024
+
+# 진행 중 세션 목록 캐시 유지 시간 (초)
+SESSIONS_CACHE_TTL = 15.0
+
+# 진행 중 세션 목록 캐시 최대 페이지 수 (커서는 클라이언트가 정하므로 크기 제한 필요)
+SESSIONS_CACHE_SIZE = 64
+
+# AI 탐색용 프로세스 수 (0이면 프로세스 풀 없이 스레드에서 탐색)
+AI_WORKERS = int(os.getenv("AI_WORKERS", str(max(1, (os.cpu_count() or 2) - 1))))
+
 
 class QuoridorService:
     """쿼리도 게임 서비스 (DB 연동)"""
 
     def __init__(self):
-        # 메모리 기반 게임 저장소 (캐시 역할)
-        self._games: dict[str, GameState] = {}
-        self._ai_instances: dict[str, SimpleAI] = {}
+        # 메모리 기반 게임 저장소 (캐시 역할, 모든 변경은 즉시 DB에 저장되므로 제거해도 복구 가능)
+        self._games = LRUCache(maxsize=MAX_HOT_GAMES, on_evict=self._on_game_evicted)
+        # 게임별 AI 난이도 (AI 인스턴스는 난이도별로 하나씩 공유)
         self._ai_difficulties: dict[str, str] = {}
+        self._ai_by_difficulty: dict[str, SimpleAI] = {}
+        # 종료된 게임의 리플레이 데이터 (game_id -> {"history": [...], step_no: state})
+        self._replay_cache = LRUCache(maxsize=REPLAY_CACHE_SIZE)
+        # 게임별 초기 상태 (game_id -> state, 게임 생성 후 변하지 않으므로 진행 중인 게임도 캐시)
+        self._initial_states = LRUCache(maxsize=REPLAY_CACHE_SIZE)
+        # 유효 이동 목록 (game_id -> (게임 객체, 상태 버전, 결과))
+        self._valid_moves_cache = LRUCache(maxsize=VALID_MOVES_CACHE_SIZE)
+        # AI 탐색용 프로세스 풀 (첫 AI 턴에서 생성)
+        self._ai_pool: Optional[ProcessPoolExecutor] = None
+        # 진행 중 세션 목록 ((limit, cursor) -> (만료 시각, 결과))
+        self._sessions_cache = LRUCache(maxsize=SESSIONS_CACHE_SIZE)
+        # (쓰기, 조회) DB 세션 팩토리와 이를 조회한 이벤트 루프 (루프별로 init_db가 새 엔진을 만들 수 있음)
+        # 조회용은 리플레이/히스토리/세션 목록에 사용 (DATABASE_READ_URL 설정 시 replica)
+        self._session_factories: tuple = (None, None)
+        self._session_factories_loop: Optional[weakref.ref] = None
+        # 게임별 백그라운드 저장 작업과 저장 대기 중인 (스냅샷, 액션) 목록 (DB_BACKGROUND_SAVES=true)
+        self._pending_saves: dict[str, asyncio.Task] = {}
+        self._queued_saves: dict[str, list[tuple[dict, dict]]] = {}
+        # flush_saves가 디바운스 대기를 끝내도록 알리는 게임별 이벤트
+        self._save_wakeups: dict[str, asyncio.Event] = {}
+        # DB에서 불러오는 중인 게임 (완료되면 제거, 결과는 _games에 보관)
+        self._loading: dict[str, asyncio.Task] = {}
+        # 진행 중인 게임 색인 (오래 갱신된 순서, DB 없을 때 목록 조회용 - 이 프로세스에서 생성/진행된 게임만 포함)
+        # game_id -> (updated_at, 세션 목록 항목), 갱신 시점에 만들어 두므로 목록 조회는 게임 객체를 거치지 않음
+        self._active_games: dict[str, tuple[datetime, dict]] = {}
+
+    def _get_session_factories(self) -> tuple:
+        """
+        캐시된 (쓰기, 조회) 세션 팩토리 반환
 
-    async def _get_repository(self) -> GameSessionRepository:
-        """DB 리포지토리 인스턴스 생성"""
-        session = get_session_factory()()
-        return GameSessionRepository(session)
+        현재 이벤트 루프에서 처음 호출될 때만 다시 조회
+        (앱 수명주기가 새 루프에서 다시 시작되면 close_db/init_db로 엔진이 바뀌므로 이전 루프의 팩토리를 쓰지 않음)
+        """
+        loop = asyncio.get_running_loop()
+        cached_loop = self._session_factories_loop
+        if cached_loop is None or cached_loop() is not loop:
+            self._session_factories = (get_session_factory(), get_read_session_factory())
+            # 닫힌 루프를 붙잡아 두지 않도록 약한 참조로 보관
+            self._session_factories_loop = weakref.ref(loop)
+        return self._session_factories
+
+    @property
+    def _session_maker(self):
+        """캐시된 DB 세션 팩토리 반환"""
+        return self._get_session_factories()[0]
+
+    @property
+    def _read_session_maker(self):
+        """캐시된 조회 전용 DB 세션 팩토리 반환"""
+        return self._get_session_factories()[1]
+
+    def _on_game_evicted(self, game_id: str, game: GameState) -> None:
+        """메모리 저장소에서 밀려난 게임의 부가 정보 정리 (DB 로드 시 난이도 복원)"""
+        if not is_db_available():
+            logger.warning("Game %s evicted from memory without DB backing", game_id)
+        self._ai_difficulties.pop(game_id, None)
+        self._valid_moves_cache.pop(game_id)
+        self._active_games.pop(game_id, None)
 
     async def _save_to_db(
         self,
@@ -49,56 +134,162 @@ class QuoridorService:
         if not is_db_available():
             return  # DB 없으면 스킵
 
+        if not is_new:
+            snapshot = game.to_dict()
+            await self._save_snapshot(game.game_id, snapshot, [(snapshot, action)] if action else [])
+            return
+
         try:
-            async with get_session_factory()() as session:
+            async with self._session_maker() as session:
                 repo = GameSessionRepository(session)
+                # 새 게임 생성
+                await repo.create(
+                    game_id=game.game_id,
+                    player1_name=game.player1.name,
+                    player2_name=game.player2.name,
+                    game_mode=game.game_mode.value,
+                    ai_difficulty=ai_difficulty,
+                    game_state=game.to_dict()
+                )
+        except Exception as e:
+            # DB 저장 실패해도 메모리 게임은 계속 진행
+            logger.warning("Failed to save game to DB: %s", e)
 
-                if is_new:
-                    # 새 게임 생성
-                    await repo.create(
-                        game_id=game.game_id,
-                        player1_name=game.player1.name,
-                        player2_name=game.player2.name,
-                        game_mode=game.game_mode.value,
-                        ai_difficulty=ai_difficulty,
-                        game_state=game.to_dict()
-                    )
-                else:
-                    # 기존 게임 업데이트
-                    status = game.status.value
-                    winner = game.winner
-                    await repo.update_game_state(
-                        game_id=game.game_id,
-                        game_state=game.to_dict(),
-                        action=action,
-                        status=status,
-                        winner=winner
-                    )
-
-                    # GameMove 테이블에도 저장 (리플레이용)
-                    if action:
-                        step_no = game.turn_count  # 현재 턴 카운트가 step_no
-                        await repo.add_move(
-                            game_id=game.game_id,
-                            step_no=step_no,
+    async def _save_snapshot(
+        self,
+        game_id: str,
+        snapshot: dict,
+        moves: list[tuple[dict, dict]]
+    ) -> None:
+        """
+        기존 게임 상태 업데이트 + 수 기록을 한 트랜잭션으로 저장 (상태와 기록이 항상 함께 반영)
+
+        Args:
+            game_id: 게임 ID
+            snapshot: 게임 행에 저장할 최신 상태
+            moves: 기록할 수 목록 ((수를 둔 직후 상태, 액션), ...) - 순서대로
+        """
+        try:
+            async with self._session_maker() as session, session.begin():
+                repo = GameSessionRepository(session)
+                # 상태 UPDATE와 GameMove INSERT(리플레이용)를 한 문장으로 저장
+                updated = await repo.update_game_state_with_moves(
+                    game_id=game_id,
+                    game_state=snapshot,
+                    status=snapshot["status"],
+                    winner=snapshot["winner"],
+                    moves=[
+                        dict(
+                            game_id=game_id,
+                            step_no=move_snapshot["turn_count"],  # 현재 턴 카운트가 step_no
                             player=action.get("player", 1),
                             action_type=action.get("type", "move"),
                             row=action.get("row", 0),
                             col=action.get("col", 0),
                             orientation=action.get("orientation"),
-                            game_state_snapshot=game.to_dict()
+                            game_state_snapshot=move_snapshot
                         )
+                        for move_snapshot, action in moves
+                    ]
+                )
+            if not updated:
+                logger.warning("Game %s not found in DB, state and moves not saved", game_id)
         except Exception as e:
             # DB 저장 실패해도 메모리 게임은 계속 진행
-            print(f"Warning: Failed to save game to DB: {e}")
+            logger.warning("Failed to save game to DB: %s", e)
+
+    async def _save_move(self, game: GameState, action: dict) -> None:
+        """
+        수 반영 후 게임 상태 저장
+
+        DB_BACKGROUND_SAVES=true면 현재 상태 스냅샷을 백그라운드 작업으로 저장하고 바로 반환
+        (메모리 게임이 기준이므로 응답은 DB 쓰기를 기다리지 않음)
+        """
+        self._track_active(game)
+
+        if not DB_BACKGROUND_SAVES:
+            await self._save_to_db(game, action=action)
+            return
+
+        if not is_db_available():
+            return
+
+        # to_dict()는 상태가 바뀌면 새 딕셔너리를 만들므로 다음 수가 스냅샷을 건드리지 않음
+        game_id = game.game_id
+        self._queued_saves.setdefault(game_id, []).append((game.to_dict(), action))
+        if game_id not in self._pending_saves:
+            self._save_wakeups[game_id] = asyncio.Event()
+            self._pending_saves[game_id] = asyncio.create_task(self._run_saves(game_id))
+
+    def _track_active(self, game: GameState) -> None:
+        """진행 중 게임 색인 갱신 (방금 갱신된 게임을 맨 뒤로, 종료된 게임은 제거)"""
+        self._active_games.pop(game.game_id, None)
+        if game.status is GameStatus.IN_PROGRESS:
+            self._active_games[game.game_id] = (game.updated_at, self._session_info(
+                game.game_id,
+                game.player1.name,
+                game.player2.name,
+                game.game_mode.value,
+                game.current_turn,
+                game.turn_count,
+                game.created_at,
+                game.updated_at
+            ))
+
+    async def _run_saves(self, game_id: str) -> None:
+        """
+        게임의 대기 중인 저장 처리 (게임별로 하나만 실행되므로 저장 순서 유지)
+
+        DB_SAVE_DEBOUNCE초 동안 들어온 수(예: 플레이어 수 직후의 AI 수)를 모아
+        게임 행 UPDATE 한 번 + 수 기록 INSERT로 한 트랜잭션에 저장
+        """
+        wakeup = self._save_wakeups[game_id]
+        try:
+            while True:
+                if DB_SAVE_DEBOUNCE > 0 and not wakeup.is_set():
+                    try:
+                        await asyncio.wait_for(wakeup.wait(), DB_SAVE_DEBOUNCE)
+                    except asyncio.TimeoutError:
+                        pass
+
+                queued = self._queued_saves.pop(game_id, None)
+                if not queued:
+                    return
+                await self._save_snapshot(game_id, queued[-1][0], queued)
+        finally:
+            del self._pending_saves[game_id]
+            del self._save_wakeups[game_id]
+
+    async def flush_saves(self, game_id: Optional[str] = None) -> None:
+        """
+        대기 중인 백그라운드 저장이 끝날 때까지 대기
+
+        Args:
+            game_id: 지정하면 해당 게임의 저장만 대기 (None이면 전체)
+        """
+        if game_id is None:
+            game_ids = list(self._pending_saves)
+        else:
+            game_ids = [game_id] if game_id in self._pending_saves else []
+
+        if not game_ids:
+            return
+
+        # 디바운스 대기 중인 저장은 바로 실행
+        for pending_id in game_ids:
+            self._save_wakeups[pending_id].set()
+        await asyncio.wait([self._pending_saves[pending_id] for pending_id in game_ids])
 
     async def _load_from_db(self, game_id: str) -> Optional[GameState]:
         """DB에서 게임 상태 복구"""
         if not is_db_available():
             return None  # DB 없으면 None 반환
 
+        # 메모리에서 밀려난 직후라면 아직 저장 중인 최신 상태를 기다림
+        await self.flush_saves(game_id)
+
         try:
-            async with get_session_factory()() as session:
+            async with self._session_maker() as session:
                 repo = GameSessionRepository(session)
                 game_session = await repo.get_by_id(game_id)
 
@@ -108,15 +299,13 @@ class QuoridorService:
                 # GameState 객체로 복원
                 game = GameState.from_dict(game_session.game_state)
 
-                # AI 인스턴스 복원 (vs_ai 모드일 때)
-                if game_session.game_mode.value == "vs_ai":
-                    difficulty = game_session.ai_difficulty or "normal"
-                    self._ai_instances[game_id] = SimpleAI(difficulty=difficulty)
-                    self._ai_difficulties[game_id] = difficulty
+                # AI 난이도 복원 (vs_ai 모드일 때)
+                if game_session.game_mode is GameMode.VS_AI:
+                    self._ai_difficulties[game_id] = game_session.ai_difficulty or "normal"
 
                 return game
         except Exception as e:
-            print(f"Warning: Failed to load game from DB: {e}")
+            logger.warning("Failed to load game from DB: %s", e)
             return None
 
     async def create_game(
@@ -134,15 +323,16 @@ class QuoridorService:
             player2_name=p2_name,
             game_mode=game_mode
         )
-        self._games[game.game_id] = game
+        self._games.put(game.game_id, game)
+        self._track_active(game)
 
-        # AI 모드일 때만 AI 인스턴스 생성
+        # AI 모드일 때만 AI 난이도 기록
         if game_mode == "vs_ai":
-            self._ai_instances[game.game_id] = SimpleAI(difficulty=ai_difficulty)
             self._ai_difficulties[game.game_id] = ai_difficulty
 
         # DB에 저장
         await self._save_to_db(game, is_new=True, ai_difficulty=ai_difficulty)
+        self._invalidate_sessions_cache()
 
         return game
 
@@ -154,12 +344,38 @@ class QuoridorService:
             return game
 
         # 메모리에 없으면 DB에서 복구 시도
-        game = await self._load_from_db(game_id)
-        if game:
-            self._games[game_id] = game
+        return await self._load_into_memory(game_id)
+
+    async def _load_into_memory(self, game_id: str) -> Optional[GameState]:
+        """
+        DB에서 게임을 불러와 메모리 저장소에 올림
+
+        같은 게임을 동시에 요청하면 DB 조회와 from_dict 복원은 한 번만 하고 모두 같은 객체를 받음
+        (각자 복원하면 서로 다른 객체에 수가 반영되어 한쪽이 사라짐)
+        """
+        task = self._loading.get(game_id)
+        if task is None:
+            task = asyncio.create_task(self._load_and_cache(game_id))
+            self._loading[game_id] = task
+        # 먼저 요청한 쪽이 취소돼도 로드는 끝까지 진행
+        return await asyncio.shield(task)
+
+    async def _load_and_cache(self, game_id: str) -> Optional[GameState]:
+        """DB 로드 후 메모리 저장소에 등록 (_load_into_memory 전용)"""
+        try:
+            game = await self._load_from_db(game_id)
+            if game:
+                self._games.put(game_id, game)
             return game
+        finally:
+            del self._loading[game_id]
 
-        return None
+    async def get_game_dict(self, game_id: str) -> Optional[dict]:
+        """게임 상태 딕셔너리 조회 (상태가 바뀌지 않았으면 캐시된 직렬화 결과 재사용)"""
+        game = await self.get_game(game_id)
+        if not game:
+            return None
+        return game.to_dict()
 
     async def move_pawn(self, game_id: str, row: int, col: int) -> tuple[bool, str, Optional[GameState]]:
         """
@@ -184,7 +400,9 @@ class QuoridorService:
                 "col": col
             }
             # DB에 저장
-            await self._save_to_db(game, action=action)
+            await self._save_move(game, action)
+            if game.status is not GameStatus.IN_PROGRESS:
+                self._invalidate_sessions_cache()
 
         return success, message, game if success else None
 
@@ -218,7 +436,7 @@ class QuoridorService:
                 "orientation": orientation
             }
             # DB에 저장
-            await self._save_to_db(game, action=action)
+            await self._save_move(game, action)
 
         return success, message, game if success else None
 
@@ -236,21 +454,21 @@ class QuoridorService:
         if game.current_turn != 2:
             return False, "Not AI's turn", None, None
 
-        if game.status.value in ("player1_win", "player2_win"):
+        if game.status in FINISHED_STATUSES:
             return False, "Game is already finished", None, None
 
-        ai = self._ai_instances.get(game_id)
-        if not ai:
-            ai = SimpleAI()
-            self._ai_instances[game_id] = ai
-
-        action = ai.get_move(game)
+        # 탐색은 다른 스레드/프로세스에서 진행되므로 그동안 같은 게임에 다른 요청(중복 AI 턴 등)이 반영될 수 있음
+        version = game.version
+        action = await self._search_ai_move(game)
         if not action:
             return False, "AI could not find a valid move", None, None
 
+        if game.version != version or game.current_turn != 2:
+            return False, "Game state changed during AI search", None, None
+
         action_info = action.to_dict()
 
-        if action.action_type.value == "move":
+        if action.action_type is ActionType.MOVE:
             success, message = game.move_pawn(action.row, action.col)
         else:
             success, message = game.place_wall(
@@ -266,20 +484,91 @@ class QuoridorService:
                 "player": 2
             }
             # DB에 저장
-            await self._save_to_db(game, action=action_with_player)
+            await self._save_move(game, action_with_player)
+            if game.status is not GameStatus.IN_PROGRESS:
+                self._invalidate_sessions_cache()
 
         return success, message, action_info, game if success else None
 
+    async def _search_ai_move(self, game: GameState):
+        """
+        AI 탐색 (CPU 작업이므로 이벤트 루프를 막지 않도록 프로세스 풀에서 실행)
+
+        워커에는 GameState.to_dict() 스냅샷만 전달하며, AI_WORKERS=0이거나
+        프로세스 풀이 비정상 종료되면 스레드에서 상태 복사본으로 탐색
+        """
+        loop = asyncio.get_running_loop()
+        difficulty = self._ai_difficulties.get(game.game_id, "normal")
+
+        if AI_WORKERS > 0:
+            if self._ai_pool is None:
+                # fork는 이벤트 루프/DB 연결 스레드를 복제하므로 spawn 사용
+                self._ai_pool = ProcessPoolExecutor(
+                    max_workers=AI_WORKERS,
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+            try:
+                return await loop.run_in_executor(
+                    self._ai_pool, search_from_snapshot, difficulty, game.to_dict()
+                )
+            except BrokenProcessPool as e:
+                logger.warning("AI process pool failed, searching in thread: %s", e)
+                self._ai_pool = None
+
+        ai = self._ai_by_difficulty.get(difficulty)
+        if not ai:
+            ai = self._ai_by_difficulty[difficulty] = SimpleAI(difficulty=difficulty)
+        return await loop.run_in_executor(None, ai.get_move, game.copy())
+
+    async def warm_up(self) -> None:
+        """
+        자주 쓰는 조회 쿼리를 한 번씩 실행해 SQLAlchemy 컴파일 캐시 채우기 (애플리케이션 시작 시)
+
+        없는 game_id로 조회하므로 결과는 비어 있고, 첫 사용자 요청이 쿼리 컴파일 비용을 내지 않음
+        (엔진별 캐시이므로 조회용 엔진이 따로 있으면 양쪽 모두 실행)
+        """
+        if not is_db_available():
+            return
+
+        game_id = "00000000-0000-0000-0000-000000000000"
+        try:
+            for session_maker in dict.fromkeys((self._session_maker, self._read_session_maker)):
+                async with session_maker() as session:
+                    repo = GameSessionRepository(session)
+                    await repo.get_by_id(game_id)
+                    await repo.is_finished(game_id)
+                    await repo.get_version(game_id)
+                    await repo.get_active_sessions(limit=1)
+                    await repo.get_active_sessions(limit=1, before=(datetime.utcnow(), game_id))
+                    await repo.get_game_history(game_id)
+                    keyframe = await repo.get_keyframe_at_or_before(game_id, 0)
+                    await repo.get_moves_after(game_id, keyframe, 0)
+                    await repo.get_total_moves(game_id)
+        except Exception as e:
+            logger.warning("Failed to warm up DB queries: %s", e)
+
+    def shutdown(self) -> None:
+        """AI 프로세스 풀 종료 (애플리케이션 종료 시)"""
+        if self._ai_pool is not None:
+            self._ai_pool.shutdown(wait=False, cancel_futures=True)
+            self._ai_pool = None
+
     async def get_valid_moves(self, game_id: str) -> Optional[dict]:
         """유효한 이동 목록 조회"""
         game = await self.get_game(game_id)
         if not game:
             return None
 
+        # 같은 게임 객체의 상태가 바뀌지 않았으면 이전 계산 결과 재사용
+        # (DB에서 다시 로드된 게임은 버전이 0부터 시작하므로 객체 동일성도 확인)
+        cached = self._valid_moves_cache.get(game_id)
+        if cached and cached[0] is game and cached[1] == game.version:
+            return cached[2]
+
         pawn_moves = game.get_valid_pawn_moves()
         wall_placements = game.get_valid_wall_placements()
 
-        return {
+        result = {
             "valid_pawn_moves": [
                 {"row": pos.row, "col": pos.col}
                 for pos in pawn_moves
@@ -290,49 +579,61 @@ class QuoridorService:
             ],
             "walls_remaining": game.current_player.walls_remaining
         }
+        self._valid_moves_cache.put(game_id, (game, game.version, result))
+        return result
 
     async def abandon_game(self, game_id: str) -> bool:
         """게임 포기 (기록은 보존, 활성 목록에서만 제외)"""
+        self._invalidate_sessions_cache()
+
         # 메모리에서 삭제
-        if game_id in self._games:
-            del self._games[game_id]
-        if game_id in self._ai_instances:
-            del self._ai_instances[game_id]
+        self._games.pop(game_id)
+        self._active_games.pop(game_id, None)
         if game_id in self._ai_difficulties:
             del self._ai_difficulties[game_id]
+        self._valid_moves_cache.pop(game_id)
 
         # DB에서 포기 처리
         if not is_db_available():
             return True
 
+        # 늦게 끝난 백그라운드 저장이 상태를 되돌리지 않도록 먼저 완료
+        await self.flush_saves(game_id)
+
         try:
-            async with get_session_factory()() as session:
+            async with self._session_maker() as session:
                 repo = GameSessionRepository(session)
                 return await repo.abandon_game(game_id)
         except Exception as e:
-            print(f"Warning: Failed to abandon game in DB: {e}")
+            logger.warning("Failed to abandon game in DB: %s", e)
             return True
 
     async def delete_game(self, game_id: str) -> bool:
         """게임 완전 삭제 (기록도 숨김)"""
+        self._invalidate_sessions_cache()
+
         # 메모리에서 삭제
-        if game_id in self._games:
-            del self._games[game_id]
-        if game_id in self._ai_instances:
-            del self._ai_instances[game_id]
+        self._games.pop(game_id)
+        self._active_games.pop(game_id, None)
         if game_id in self._ai_difficulties:
             del self._ai_difficulties[game_id]
+        self._valid_moves_cache.pop(game_id)
+        self._replay_cache.pop(game_id)
+        self._initial_states.pop(game_id)
 
         # DB에서 완전 삭제
         if not is_db_available():
             return True
 
+        # 늦게 끝난 백그라운드 저장이 상태를 되돌리지 않도록 먼저 완료
+        await self.flush_saves(game_id)
+
         try:
-            async with get_session_factory()() as session:
+            async with self._session_maker() as session:
                 repo = GameSessionRepository(session)
                 return await repo.hard_delete(game_id)
         except Exception as e:
-            print(f"Warning: Failed to delete game from DB: {e}")
+            logger.warning("Failed to delete game from DB: %s", e)
             return True
 
     async def recover_game(self, game_id: str) -> Optional[GameState]:
@@ -343,68 +644,173 @@ class QuoridorService:
             복구된 GameState 또는 None
         """
         # 이미 메모리에 있으면 그대로 반환
-        if game_id in self._games:
-            return self._games[game_id]
-
-        # DB에서 복구
-        game = await self._load_from_db(game_id)
+        game = self._games.get(game_id)
         if game:
-            self._games[game_id] = game
             return game
 
-        return None
+        # DB에서 복구
+        return await self._load_into_memory(game_id)
+
+    async def get_active_sessions(
+        self,
+        limit: int = 50,
+        cursor: Optional[str] = None
+    ) -> tuple[list[dict], Optional[str]]:
+        """
+        진행 중인 게임 세션 목록 (updated_at 내림차순, SESSIONS_CACHE_TTL 동안 캐시)
+
+        Args:
+            limit: 페이지 크기
+            cursor: 이전 페이지의 next_page_token
+
+        Returns:
+            (세션 목록, 다음 페이지 토큰 또는 None)
+
+        Raises:
+            ValueError: 잘못된 커서
+        """
+        before = self._decode_cursor(cursor) if cursor else None
+
+        cache_key = (limit, cursor)
+        cached = self._sessions_cache.get(cache_key)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+
+        # 다음 페이지 존재 여부 확인을 위해 하나 더 조회
+        rows = await self._fetch_active_sessions(limit + 1, before)
+        if rows is None:
+            return [], None
+
+        next_page_token = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_page_token = self._encode_cursor(rows[-1][0], rows[-1][1]["game_id"])
+
+        result = ([session for _, session in rows], next_page_token)
+        self._sessions_cache.put(cache_key, (time.monotonic() + SESSIONS_CACHE_TTL, result))
+        return result
+
+    def _invalidate_sessions_cache(self) -> None:
+        """세션 목록 캐시 무효화 (게임 생성/종료/포기/삭제 시)"""
+        self._sessions_cache.clear()
+
+    @staticmethod
+    def _encode_cursor(updated_at: datetime, game_id: str) -> str:
+        """키셋 커서 (updated_at, game_id)를 URL-safe 토큰으로 변환"""
+        raw = f"{updated_at.isoformat()}|{game_id}".encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> tuple[datetime, str]:
+        """페이지 토큰을 키셋 커서 (updated_at, game_id)로 변환 (잘못된 토큰이면 ValueError)"""
+        try:
+            raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+            updated_at, game_id = raw.split("|", 1)
+            return datetime.fromisoformat(updated_at), game_id
+        except (binascii.Error, UnicodeDecodeError) as e:
+            raise ValueError(f"Invalid cursor: {e}") from e
+
+    @staticmethod
+    def _session_info(
+        game_id: str,
+        player1_name: str,
+        player2_name: str,
+        game_mode: str,
+        current_turn: int,
+        turn_count: int,
+        created_at: datetime,
+        updated_at: datetime
+    ) -> dict:
+        """세션 목록 항목 (시각은 datetime 그대로 두고 응답 직렬화 시 orjson이 문자열로 변환)"""
+        return {
+            "game_id": game_id,
+            "player1_name": player1_name,
+            "player2_name": player2_name,
+            "game_mode": game_mode,
+            "current_turn": current_turn,
+            "turn_count": turn_count,
+            "created_at": created_at,
+            "updated_at": updated_at
+        }
 
-    async def get_active_sessions(self, limit: int = 50) -> list[dict]:
-        """진행 중인 게임 세션 목록"""
+    async def _fetch_active_sessions(
+        self,
+        limit: int,
+        before: Optional[tuple[datetime, str]]
+    ) -> Optional[list[tuple[datetime, dict]]]:
+        """진행 중인 게임 세션 목록 조회 ((updated_at, 세션 정보) 목록, DB 조회 실패 시 None)"""
         if not is_db_available():
-            # DB 없으면 메모리에서 진행 중인 게임 반환
-            return [
-                {
-                    "game_id": game.game_id,
-                    "player1_name": game.player1.name,
-                    "player2_name": game.player2.name,
-                    "game_mode": game.game_mode.value,
-                    "current_turn": game.current_turn,
-                    "turn_count": game.turn_count,
-                    "created_at": game.created_at.isoformat() + "Z",
-                    "updated_at": game.updated_at.isoformat() + "Z"
-                }
-                for game in list(self._games.values())[:limit]
-                if game.status.value == "in_progress"
-            ]
+            # DB 없으면 진행 중 게임 색인을 최근 갱신 순으로 순회 (커서 이후부터 limit개)
+            return list(islice(
+                (
+                    row for row in reversed(self._active_games.values())
+                    if before is None or (row[0], row[1]["game_id"]) < before
+                ),
+                limit
+            ))
 
         try:
-            async with get_session_factory()() as session:
+            async with self._read_session_maker() as session:
                 repo = GameSessionRepository(session)
-                sessions = await repo.get_active_sessions(limit=limit)
+                sessions = await repo.get_active_sessions(limit=limit, before=before)
                 return [
-                    {
-                        "game_id": s.game_id,
-                        "player1_name": s.player1_name,
-                        "player2_name": s.player2_name,
-                        "game_mode": s.game_mode.value,
-                        "current_turn": s.current_turn,
-                        "turn_count": s.turn_count,
-                        "created_at": s.created_at.isoformat() + "Z",
-                        "updated_at": s.updated_at.isoformat() + "Z"
-                    }
+                    (s.updated_at, self._session_info(
+                        s.game_id,
+                        s.player1_name,
+                        s.player2_name,
+                        s.game_mode.value,
+                        s.current_turn,
+                        s.turn_count,
+                        s.created_at,
+                        s.updated_at
+                    ))
                     for s in sessions
                 ]
         except Exception as e:
-            print(f"Warning: Failed to get active sessions: {e}")
-            return []
+            logger.warning("Failed to get active sessions: %s", e)
+            return None
+
+    async def get_history_version(self, game_id: str) -> Optional[tuple[int, str]]:
+        """
+        히스토리 변경 여부 판단용 (turn_count, status) 조회 (수 기록은 읽지 않음)
+
+        히스토리와 같은 DB(조회용)에서 먼저 읽으므로 이후 읽는 히스토리는 항상 이 버전 이후 상태
+        """
+        if not is_db_available():
+            game = self._games.get(game_id)
+            return (game.turn_count, game.status.value) if game else None
+
+        # 저장 대기 중인 상태/수 기록 반영 (DB_BACKGROUND_SAVES)
+        await self.flush_saves(game_id)
+
+        try:
+            async with self._read_session_maker() as session:
+                return await GameSessionRepository(session).get_version(game_id)
+        except Exception as e:
+            logger.warning("Failed to get game version: %s", e)
+            return None
 
     async def get_game_history(self, game_id: str) -> Optional[list]:
-        """게임 히스토리 조회 (리플레이용) - 기존 JSONB 방식"""
+        """게임 히스토리 조회 (리플레이용)"""
         if not is_db_available():
             return [] if game_id in self._games else None
 
+        cached = self._replay_cache.get(game_id, {})
+        if "history" in cached:
+            return cached["history"]
+
+        # 저장 대기 중인 상태/수 기록 반영 (DB_BACKGROUND_SAVES)
+        await self.flush_saves(game_id)
+
         try:
-            async with get_session_factory()() as session:
+            async with self._read_session_maker() as session:
                 repo = GameSessionRepository(session)
-                return await repo.get_game_history(game_id)
+                history = await repo.get_game_history(game_id)
+                if history is not None and await repo.is_finished(game_id):
+                    self._cache_replay_data(game_id, "history", history)
+                return history
         except Exception as e:
-            print(f"Warning: Failed to get game history: {e}")
+            logger.warning("Failed to get game history: %s", e)
             return None
 
     # ===== 리플레이 시스템 메서드 =====
@@ -414,13 +820,15 @@ class QuoridorService:
         if not is_db_available():
             return None
 
+        await self.flush_saves(game_id)
+
         try:
-            async with get_session_factory()() as session:
+            async with self._read_session_maker() as session:
                 repo = GameSessionRepository(session)
                 moves = await repo.get_moves(game_id)
                 return [move.to_dict() for move in moves]
         except Exception as e:
-            print(f"Warning: Failed to get replay moves: {e}")
+            logger.warning("Failed to get replay moves: %s", e)
             return None
 
     async def get_state_at_step(self, game_id: str, step_no: int) -> Optional[dict]:
@@ -428,23 +836,84 @@ class QuoridorService:
         if not is_db_available():
             return None
 
-        try:
-            async with get_session_factory()() as session:
-                repo = GameSessionRepository(session)
+        cached = self._replay_cache.get(game_id, {})
+        if step_no in cached:
+            return cached[step_no]
 
-                if step_no < 0:
-                    # 초기 상태 요청 시 게임 세션의 초기 상태 반환
-                    game_session = await repo.get_by_id(game_id)
-                    if not game_session:
-                        return None
-                    # 초기 상태 구성
-                    return self._get_initial_state(game_session)
+        await self.flush_saves(game_id)
 
-                return await repo.get_state_at_step(game_id, step_no)
+        try:
+            async with self._read_session_maker() as session:
+                repo = GameSessionRepository(session)
+                state = await self._build_state_at_step(repo, game_id, step_no)
+                if state is not None and await repo.is_finished(game_id):
+                    self._cache_replay_data(game_id, step_no, state)
+                return state
         except Exception as e:
-            print(f"Warning: Failed to get state at step: {e}")
+            logger.warning("Failed to get state at step: %s", e)
+            return None
+
+    async def _build_state_at_step(
+        self,
+        repo: GameSessionRepository,
+        game_id: str,
+        step_no: int
+    ) -> Optional[dict]:
+        """DB 기록으로 특정 스텝의 게임 상태 구성"""
+        if step_no < 0:
+            # 초기 상태 요청 시 게임 세션의 초기 상태 반환
+            return await self._fetch_initial_state(repo, game_id)
+
+        # 가장 가까운 키프레임 스냅샷부터 이후 수를 재생하여 상태 복원
+        keyframe = await repo.get_keyframe_at_or_before(game_id, step_no)
+        moves = await repo.get_moves_after(game_id, keyframe, step_no)
+
+        last_move = moves[-1] if moves else keyframe
+        if not last_move or last_move.step_no != step_no:
+            return None  # 해당 스텝의 수가 없음
+
+        base_state = await self._fetch_initial_state(repo, game_id)
+        if base_state is None:
             return None
 
+        if keyframe:
+            # 압축 스냅샷에 세션 메타데이터를 채워 복원 (캐시된 초기 상태는 수정하지 않음)
+            base_state = GameSerializer.state_from_bits(
+                keyframe.game_state_snapshot,
+                {**base_state, "updated_at": keyframe.created_at.isoformat() + "Z"}
+            )
+
+        if not moves:
+            return base_state
+
+        return GameSerializer.replay_moves(
+            base_state,
+            [MoveRecord.from_dict(move.to_dict()) for move in moves]
+        )
+
+    def _cache_replay_data(self, game_id: str, key, value) -> None:
+        """종료된 게임의 리플레이 데이터 캐시 (이후 변경되지 않으므로 무효화 불필요)"""
+        entry = self._replay_cache.get(game_id)
+        if entry is None:
+            entry = {}
+            self._replay_cache.put(game_id, entry)
+        entry[key] = value
+
+    async def _fetch_initial_state(
+        self,
+        repo: GameSessionRepository,
+        game_id: str
+    ) -> Optional[dict]:
+        """게임의 초기 상태 조회 (캐시에 없을 때만 세션 조회, 반환값은 수정하지 말 것)"""
+        state = self._initial_states.get(game_id)
+        if state is None:
+            game_session = await repo.get_by_id(game_id)
+            if not game_session:
+                return None
+            state = self._get_initial_state(game_session)
+            self._initial_states.put(game_id, state)
+        return state
+
     def _get_initial_state(self, game_session) -> dict:
         """게임의 초기 상태 생성"""
         return {
@@ -478,12 +947,14 @@ class QuoridorService:
         if not is_db_available():
             return 0
 
+        await self.flush_saves(game_id)
+
         try:
-            async with get_session_factory()() as session:
+            async with self._read_session_maker() as session:
                 repo = GameSessionRepository(session)
                 return await repo.get_total_moves(game_id)
         except Exception as e:
-            print(f"Warning: Failed to get total moves: {e}")
+            logger.warning("Failed to get total moves: %s", e)
             return 0
 
 
@@ -0,0 +1,9 @@
+-- 001: game_moves 리플레이 조회용 복합 인덱스 (game_id, step_no)
+-- game_id 단일 인덱스는 복합 인덱스의 앞부분으로 대체되므로 삭제
+
+BEGIN;
+
+CREATE INDEX IF NOT EXISTS ix_game_moves_game_step ON game_moves (game_id, step_no);
+DROP INDEX IF EXISTS ix_game_moves_game_id;
+
+COMMIT;
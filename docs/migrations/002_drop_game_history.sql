@@ -0,0 +1,8 @@
+-- 002: game_sessions.game_history 삭제
+-- 수 기록은 game_moves 테이블에 이미 저장되어 있으므로 데이터 이전 없이 컬럼만 삭제
+
+BEGIN;
+
+ALTER TABLE game_sessions DROP COLUMN IF EXISTS game_history;
+
+COMMIT;
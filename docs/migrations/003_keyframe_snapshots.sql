@@ -0,0 +1,19 @@
+-- 003: game_moves.game_state_snapshot을 키프레임에만 저장
+-- 키프레임: SNAPSHOT_INTERVAL(20) 배수 스텝, 게임 종료 수 (backend_fastapi/database/repository.py)
+-- 나머지 수의 기존 스냅샷은 NULL로 비워 공간 회수 (리플레이는 가장 가까운 키프레임부터 수를 재생)
+
+BEGIN;
+
+ALTER TABLE game_moves ALTER COLUMN game_state_snapshot DROP NOT NULL;
+
+UPDATE game_moves
+SET game_state_snapshot = NULL
+WHERE game_state_snapshot IS NOT NULL
+  AND step_no % 20 <> 0
+  AND game_state_snapshot ->> 'status' = 'in_progress';
+
+CREATE INDEX IF NOT EXISTS ix_game_moves_keyframe
+    ON game_moves (game_id, step_no)
+    WHERE game_state_snapshot IS NOT NULL;
+
+COMMIT;
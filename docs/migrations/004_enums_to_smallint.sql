@@ -0,0 +1,31 @@
+-- 004: status / game_mode / action_type Enum 컬럼을 SMALLINT로 변경
+-- 값은 Enum 정의 순서의 인덱스 (EnumAsInt, backend_fastapi/database/models.py)
+--   game_status: IN_PROGRESS=0, PLAYER1_WIN=1, PLAYER2_WIN=2, ABANDONED=3
+--   game_mode:   VS_AI=0, LOCAL_2P=1
+--   action_type: MOVE=0, WALL=1
+
+BEGIN;
+
+ALTER TABLE game_sessions
+    ALTER COLUMN status TYPE smallint USING CASE status::text
+        WHEN 'IN_PROGRESS' THEN 0
+        WHEN 'PLAYER1_WIN' THEN 1
+        WHEN 'PLAYER2_WIN' THEN 2
+        WHEN 'ABANDONED' THEN 3
+    END,
+    ALTER COLUMN game_mode TYPE smallint USING CASE game_mode::text
+        WHEN 'VS_AI' THEN 0
+        WHEN 'LOCAL_2P' THEN 1
+    END;
+
+ALTER TABLE game_moves
+    ALTER COLUMN action_type TYPE smallint USING CASE action_type::text
+        WHEN 'MOVE' THEN 0
+        WHEN 'WALL' THEN 1
+    END;
+
+DROP TYPE IF EXISTS game_status;
+DROP TYPE IF EXISTS game_mode;
+DROP TYPE IF EXISTS action_type;
+
+COMMIT;
@@ -0,0 +1,10 @@
+-- 005: 진행 중 세션 목록(get_active_sessions)용 부분 인덱스 (status 0 = IN_PROGRESS)
+-- 004 적용 후 실행 (status가 SMALLINT여야 함)
+
+BEGIN;
+
+CREATE INDEX IF NOT EXISTS ix_game_sessions_active
+    ON game_sessions (updated_at)
+    WHERE status = 0 AND is_deleted = false;
+
+COMMIT;
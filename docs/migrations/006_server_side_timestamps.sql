@@ -0,0 +1,13 @@
+-- 006: created_at / updated_at 기본값을 DB 서버 시각(UTC)으로 생성
+-- 기존 행의 값은 그대로 두고 기본값만 추가 (updated_at 갱신은 ORM의 onupdate가 처리)
+
+BEGIN;
+
+ALTER TABLE game_sessions
+    ALTER COLUMN created_at SET DEFAULT timezone('utc', now()),
+    ALTER COLUMN updated_at SET DEFAULT timezone('utc', now());
+
+ALTER TABLE game_moves
+    ALTER COLUMN created_at SET DEFAULT timezone('utc', now());
+
+COMMIT;
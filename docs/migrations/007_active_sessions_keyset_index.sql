@@ -0,0 +1,10 @@
+-- 007: 진행 중 세션 부분 인덱스에 game_id 추가 (updated_at, game_id 키셋 페이지네이션)
+
+BEGIN;
+
+DROP INDEX IF EXISTS ix_game_sessions_active;
+CREATE INDEX ix_game_sessions_active
+    ON game_sessions (updated_at, game_id)
+    WHERE status = 0 AND is_deleted = false;
+
+COMMIT;
@@ -0,0 +1,13 @@
+-- 008: game_moves.game_state_snapshot을 JSONB에서 압축 바이트(BYTEA)로 변경
+-- 새 형식은 GameSerializer.state_to_bits(Python)로만 만들 수 있으므로 기존 JSONB 스냅샷은 NULL로 비움
+-- 키프레임이 없는 게임은 초기 상태부터 수를 재생하여 리플레이 (이후 저장되는 키프레임은 새 형식)
+
+BEGIN;
+
+ALTER TABLE game_moves ALTER COLUMN game_state_snapshot TYPE bytea USING NULL;
+
+CREATE INDEX IF NOT EXISTS ix_game_moves_keyframe
+    ON game_moves (game_id, step_no)
+    WHERE game_state_snapshot IS NOT NULL;
+
+COMMIT;
@@ -1,18 +1,53 @@
 """
 Simple AI Module
-휴리스틱 기반 AI 플레이어
+휴리스틱 기반 AI 플레이어 (알파-베타 탐색 + 반복 심화)
 """
 
+import math
 import random
+import threading
+import time
+from dataclasses import dataclass
 from typing import Optional
 
-from ..core.game_state import GameState, Action, ActionType
+from ..core.game_state import GameState, Action, ActionType, FINISHED_STATUSES
 from ..core.board import Board, Position
-from ..core.wall import Wall, Orientation
+from ..core.wall import Wall, ALL_WALLS
 from ..core.move_validator import MoveValidator
 from ..core.pathfinder import Pathfinder
 
 
+# 난이도별 최대 탐색 깊이 / 탐색 시간 제한 (초)
+SEARCH_DEPTHS = {"easy": 1, "normal": 3, "hard": 5}
+SEARCH_TIME_LIMITS = {"easy": 0.2, "normal": 1.0, "hard": 2.0}
+
+# 노드당 탐색할 벽 후보 수 (휴리스틱 상위 N개)
+MAX_WALL_CANDIDATES = 8
+
+WIN_SCORE = 1000
+
+# 전치표 최대 항목 수 (초과 시 가장 먼저 들어온 항목부터 제거)
+TT_MAX_ENTRIES = 1 << 20
+
+# 전치표 값 종류
+TT_EXACT = 0
+TT_LOWER = 1  # 실제 값 >= value (베타 컷)
+TT_UPPER = 2  # 실제 값 <= value (알파 컷)
+
+
+@dataclass
+class _TTEntry:
+    """전치표 항목"""
+    depth: int
+    value: float
+    flag: int
+    best_move: Optional[Action]
+
+
+class _SearchTimeout(Exception):
+    """탐색 시간 초과"""
+
+
 class SimpleAI:
     """휴리스틱 기반 AI"""
 
@@ -25,15 +60,28 @@ class SimpleAI:
 
         # 난이도별 설정
         if difficulty == "easy":
-            self.wall_probability = 0.1  # 벽 설치 확률
             self.randomness = 0.3  # 랜덤 행동 확률
         elif difficulty == "hard":
-            self.wall_probability = 0.4
             self.randomness = 0.05
         else:  # normal
-            self.wall_probability = 0.25
             self.randomness = 0.15
 
+        self.max_depth = SEARCH_DEPTHS.get(difficulty, SEARCH_DEPTHS["normal"])
+        self.time_limit = SEARCH_TIME_LIMITS.get(difficulty, SEARCH_TIME_LIMITS["normal"])
+
+        # 탐색 중 상태
+        self._player_id = 2
+        self._deadline = 0.0
+        self._can_timeout = False
+
+        # 전치표 (zobrist_key -> _TTEntry), 평가 관점(AI 플레이어 번호)별로 분리
+        # 인스턴스를 여러 게임이 공유하므로 다른 게임의 탐색 결과도 재사용됨
+        self._tt_by_player: dict[int, dict[int, _TTEntry]] = {1: {}, 2: {}}
+        self._tt: dict[int, _TTEntry] = self._tt_by_player[2]
+
+        # 여러 게임이 한 인스턴스를 공유하므로 탐색 상태 보호
+        self._lock = threading.Lock()
+
     def get_move(self, game_state: GameState) -> Optional[Action]:
         """
         AI의 다음 행동 결정
@@ -44,8 +92,11 @@ class SimpleAI:
         Returns:
             수행할 Action 또는 None
         """
+        with self._lock:
+            return self._get_move(game_state)
+
+    def _get_move(self, game_state: GameState) -> Optional[Action]:
         ai_player = game_state.current_player
-        opponent = game_state.opponent_player
 
         # 유효한 이동 목록 가져오기
         valid_moves = game_state.get_valid_pawn_moves()
@@ -58,153 +109,234 @@ class SimpleAI:
         if random.random() < self.randomness:
             return self._random_action(valid_moves, valid_walls)
 
-        # 전략적 결정
-        return self._strategic_action(game_state, valid_moves, valid_walls)
+        # 알파-베타 탐색
+        return self._search(game_state)
 
-    def _strategic_action(
-        self,
-        game_state: GameState,
-        valid_moves: list[Position],
-        valid_walls: list[Wall]
-    ) -> Action:
-        """전략적 행동 결정"""
-        ai_player = game_state.current_player
-        opponent = game_state.opponent_player
-        wall_manager = game_state.wall_manager
+    # ===== 탐색 =====
 
-        # 각 플레이어의 목표까지 거리 계산
-        ai_distance = Pathfinder.get_shortest_distance(
-            ai_player.position, ai_player.goal_row, wall_manager
-        )
-        opponent_distance = Pathfinder.get_shortest_distance(
-            opponent.position, opponent.goal_row, wall_manager
-        )
+    def _search(self, game_state: GameState) -> Optional[Action]:
+        """
+        반복 심화 알파-베타 탐색
 
-        # 1. 승리 직전이면 무조건 이동
-        if ai_distance == 1:
-            return self._move_to_goal(valid_moves, ai_player.goal_row)
-
-        # 2. 상대가 더 가까우면 벽으로 방해
-        if (
-            opponent_distance < ai_distance
-            and valid_walls
-            and random.random() < self.wall_probability + 0.2
-        ):
-            wall = self._find_blocking_wall(game_state, valid_walls)
-            if wall:
-                return Action(
-                    action_type=ActionType.WALL,
-                    row=wall.row,
-                    col=wall.col,
-                    orientation=wall.orientation
+        깊이 1부터 max_depth까지 탐색하며, 시간 제한을 넘으면
+        마지막으로 완료된 깊이의 최선 수를 반환
+        """
+        self._player_id = game_state.current_turn
+        self._tt = self._tt_by_player[self._player_id]
+        self._deadline = time.perf_counter() + self.time_limit
+
+        best_action = None
+        for depth in range(1, self.max_depth + 1):
+            # 깊이 1은 항상 끝까지 탐색 (반환할 수 보장)
+            self._can_timeout = best_action is not None
+            try:
+                value, action = self._alphabeta(
+                    game_state, depth, -math.inf, math.inf, best_action
                 )
+            except _SearchTimeout:
+                break
 
-        # 3. 벽 설치 확률 체크
-        if valid_walls and random.random() < self.wall_probability:
-            wall = self._find_blocking_wall(game_state, valid_walls)
-            if wall:
-                return Action(
-                    action_type=ActionType.WALL,
-                    row=wall.row,
-                    col=wall.col,
-                    orientation=wall.orientation
-                )
+            if action is not None:
+                best_action = action
 
-        # 4. 기본: 목표 방향으로 이동
-        best_move = self._find_best_move(valid_moves, ai_player.goal_row, wall_manager)
-        return Action(
-            action_type=ActionType.MOVE,
-            row=best_move.row,
-            col=best_move.col
-        )
+            # 승패가 확정된 수를 찾았으면 더 깊이 볼 필요 없음
+            if abs(value) >= WIN_SCORE:
+                break
 
-    def _move_to_goal(self, valid_moves: list[Position], goal_row: int) -> Action:
-        """목표 행으로 이동"""
-        for move in valid_moves:
-            if move.row == goal_row:
-                return Action(
-                    action_type=ActionType.MOVE,
-                    row=move.row,
-                    col=move.col
-                )
+        return best_action
 
-        # 목표 행 이동이 없으면 가장 가까운 이동
-        best_move = min(valid_moves, key=lambda m: abs(m.row - goal_row))
-        return Action(
-            action_type=ActionType.MOVE,
-            row=best_move.row,
-            col=best_move.col
-        )
-
-    def _find_best_move(
+    def _alphabeta(
         self,
-        valid_moves: list[Position],
-        goal_row: int,
-        wall_manager
-    ) -> Position:
-        """최적의 이동 위치 찾기"""
-        if not valid_moves:
-            raise ValueError("No valid moves available")
-
-        # 각 이동 후 목표까지 거리 계산
-        move_scores = []
-        for move in valid_moves:
-            distance = Pathfinder.get_shortest_distance(move, goal_row, wall_manager)
-            # 거리가 짧을수록 좋음 (점수 높음)
-            move_scores.append((move, -distance if distance >= 0 else -100))
-
-        # 최고 점수 이동 선택 (동점이면 랜덤)
-        max_score = max(score for _, score in move_scores)
-        best_moves = [move for move, score in move_scores if score == max_score]
-
-        return random.choice(best_moves)
+        state: GameState,
+        depth: int,
+        alpha: float,
+        beta: float,
+        first_action: Optional[Action] = None
+    ) -> tuple[float, Optional[Action]]:
+        """
+        알파-베타 가지치기 미니맥스
 
-    def _find_blocking_wall(
-        self,
-        game_state: GameState,
-        valid_walls: list[Wall]
-    ) -> Optional[Wall]:
-        """상대방을 효과적으로 방해하는 벽 찾기"""
-        opponent = game_state.opponent_player
-        wall_manager = game_state.wall_manager
+        Args:
+            state: 탐색할 상태
+            depth: 남은 깊이
+            alpha: 최대화 측 하한
+            beta: 최소화 측 상한
+            first_action: 먼저 탐색할 수 (이전 반복의 최선 수)
 
-        # 현재 상대방 거리
-        current_distance = Pathfinder.get_shortest_distance(
-            opponent.position, opponent.goal_row, wall_manager
+        Returns:
+            (평가값, 최선 수)
+        """
+        if self._can_timeout and time.perf_counter() > self._deadline:
+            raise _SearchTimeout()
+
+        if state.status in FINISHED_STATUSES:
+            # 빨리 이길수록 / 늦게 질수록 좋음
+            score = WIN_SCORE + depth
+            return (score if state.winner == self._player_id else -score), None
+
+        if depth == 0:
+            return self._evaluate(state), None
+
+        # 전치표 조회 (같은 상태를 충분한 깊이로 이미 탐색했으면 저장된 값 사용)
+        key = state.zobrist_key
+        alpha_orig, beta_orig = alpha, beta
+        entry = self._tt.get(key)
+        if entry is not None:
+            if entry.depth >= depth:
+                if entry.flag == TT_EXACT:
+                    return entry.value, entry.best_move
+                if entry.flag == TT_LOWER:
+                    alpha = max(alpha, entry.value)
+                else:
+                    beta = min(beta, entry.value)
+                if alpha >= beta:
+                    return entry.value, entry.best_move
+            if first_action is None:
+                first_action = entry.best_move
+
+        maximizing = state.current_turn == self._player_id
+        best_value = -math.inf if maximizing else math.inf
+        best_action = None
+
+        for action in self._ordered_actions(state, first_action):
+            child = self._apply(state, action)
+            if child is None:
+                continue
+
+            value, _ = self._alphabeta(child, depth - 1, alpha, beta)
+
+            if maximizing:
+                if value > best_value:
+                    best_value, best_action = value, action
+                alpha = max(alpha, value)
+            else:
+                if value < best_value:
+                    best_value, best_action = value, action
+                beta = min(beta, value)
+
+            if alpha >= beta:
+                break
+
+        if best_action is None:
+            return self._evaluate(state), None
+
+        if best_value <= alpha_orig:
+            flag = TT_UPPER
+        elif best_value >= beta_orig:
+            flag = TT_LOWER
+        else:
+            flag = TT_EXACT
+        self._store(key, _TTEntry(depth, best_value, flag, best_action))
+
+        return best_value, best_action
+
+    def _store(self, key: int, entry: _TTEntry) -> None:
+        """전치표 저장 (최대 크기 초과 시 FIFO 제거)"""
+        if key not in self._tt and len(self._tt) >= TT_MAX_ENTRIES:
+            del self._tt[next(iter(self._tt))]
+        self._tt[key] = entry
+
+    def _evaluate(self, state: GameState) -> float:
+        """AI 기준 상태 평가: 상대 거리 - 내 거리 (남은 벽 수를 약간 반영)"""
+        me = state.player1 if self._player_id == 1 else state.player2
+        opponent = state.player2 if self._player_id == 1 else state.player1
+
+        # 거리 필드 조회 (BFS는 벽이 바뀐 상태에서만 1회)
+        my_distance = self._distance(state, me.position, me.goal_row)
+        opponent_distance = self._distance(state, opponent.position, opponent.goal_row)
+
+        return (
+            opponent_distance - my_distance
+            + 0.1 * (me.walls_remaining - opponent.walls_remaining)
         )
 
-        # 벽 효과 평가
-        best_walls = []
-        best_increase = 0
-
-        # 샘플링 (전체 검사는 너무 느림)
-        sample_size = min(50, len(valid_walls))
-        sampled_walls = random.sample(valid_walls, sample_size)
-
-        for wall in sampled_walls:
-            # 임시로 벽 설치
-            temp_manager = wall_manager.copy()
-            temp_manager.add_wall(wall)
+    def _ordered_actions(
+        self,
+        state: GameState,
+        first_action: Optional[Action] = None
+    ) -> list[Action]:
+        """
+        탐색할 수 목록 (h = 상대 거리 - 내 거리 변화가 큰 순서로 정렬)
 
-            new_distance = Pathfinder.get_shortest_distance(
-                opponent.position, opponent.goal_row, temp_manager
-            )
+        벽은 상대 최단 경로를 막는 후보 중 상위 MAX_WALL_CANDIDATES개만 포함
+        """
+        player = state.current_player
+        opponent = state.opponent_player
 
-            if new_distance < 0:
-                continue  # 경로 없음 (유효하지 않은 벽)
+        opponent_distance = self._distance(state, opponent.position, opponent.goal_row)
 
-            increase = new_distance - current_distance
+        scored: list[tuple[float, Action]] = []
 
-            if increase > best_increase:
-                best_increase = increase
-                best_walls = [wall]
-            elif increase == best_increase and increase > 0:
-                best_walls.append(wall)
+        for move in state.get_valid_pawn_moves():
+            distance = self._distance(state, move, player.goal_row)
+            scored.append((
+                opponent_distance - distance,
+                Action(action_type=ActionType.MOVE, row=move.row, col=move.col)
+            ))
 
-        if best_walls:
-            return random.choice(best_walls)
+        if player.has_walls():
+            wall_scores = []
+            for wall in self._candidate_walls(state):
+                wall_blocked = state.wall_manager.block_masks_with(wall)
+                new_opponent = Pathfinder.get_distance_bitboard(
+                    opponent.position, opponent.goal_row, wall_blocked
+                )
+                new_mine = Pathfinder.get_distance_bitboard(
+                    player.position, player.goal_row, wall_blocked
+                )
+                if new_opponent < 0 or new_mine < 0 or new_opponent <= opponent_distance:
+                    continue  # 상대를 늦추지 못하는 벽은 제외
+                wall_scores.append((
+                    new_opponent - new_mine,
+                    Action(
+                        action_type=ActionType.WALL,
+                        row=wall.row,
+                        col=wall.col,
+                        orientation=wall.orientation
+                    )
+                ))
+
+            wall_scores.sort(key=lambda item: item[0], reverse=True)
+            scored.extend(wall_scores[:MAX_WALL_CANDIDATES])
+
+        scored.sort(key=lambda item: item[0], reverse=True)
+        actions = [action for _, action in scored]
+
+        if first_action is not None and first_action in actions:
+            actions.remove(first_action)
+            actions.insert(0, first_action)
+
+        return actions
+
+    @staticmethod
+    def _distance(state: GameState, position: Position, goal_row: int) -> int:
+        """거리 필드에서 위치의 목표까지 거리 조회"""
+        return state.compute_dist_field(goal_row)[position.row * Board.SIZE + position.col]
+
+    @staticmethod
+    def _candidate_walls(state: GameState) -> list[Wall]:
+        """상대 최단 경로를 가로지르는 설치 가능한 벽 (경로 보장은 적용 시 검사)"""
+        opponent = state.opponent_player
+        wall_manager = state.wall_manager
+        path_edges = MoveValidator._get_path_edges(
+            opponent.position, opponent.goal_row, wall_manager
+        )
 
-        return None
+        candidates = []
+        for wall in ALL_WALLS:
+            if wall.get_blocked_edges() & path_edges and wall_manager.can_place_wall(wall):
+                candidates.append(wall)
+        return candidates
+
+    @staticmethod
+    def _apply(state: GameState, action: Action) -> Optional[GameState]:
+        """상태 복사본에 수를 적용 (실패 시 None)"""
+        child = state.copy()
+        if action.action_type is ActionType.MOVE:
+            success, _ = child.move_pawn(action.row, action.col)
+        else:
+            success, _ = child.place_wall(action.row, action.col, action.orientation.value)
+        return child if success else None
 
     def _random_action(
         self,
@@ -231,3 +363,26 @@ class SimpleAI:
             ))
 
         return random.choice(actions) if actions else None
+
+
+# ===== 프로세스 풀 워커용 =====
+
+# 워커 프로세스별 난이도당 AI 인스턴스 (전치표를 워커가 처리하는 모든 게임이 공유)
+_worker_ais: dict[str, SimpleAI] = {}
+
+
+def search_from_snapshot(difficulty: str, snapshot: dict) -> Optional[Action]:
+    """
+    프로세스 풀 워커에서 실행: 상태 스냅샷(GameState.to_dict)을 복원해 AI의 다음 행동 결정
+
+    Args:
+        difficulty: AI 난이도
+        snapshot: GameState.to_dict() 결과
+
+    Returns:
+        수행할 Action 또는 None
+    """
+    ai = _worker_ais.get(difficulty)
+    if ai is None:
+        ai = _worker_ais[difficulty] = SimpleAI(difficulty=difficulty)
+    return ai.get_move(GameState.from_dict(snapshot))
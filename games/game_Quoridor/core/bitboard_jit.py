@@ -0,0 +1,122 @@
+"""
+Bitboard JIT Module
+비트보드 BFS 거리 계산의 Numba JIT 버전 (numba 미설치 시 NUMBA_AVAILABLE = False)
+
+81칸 비트보드는 uint64 하나에 들어가지 않으므로 (하위 64비트, 상위 17비트) 두 개로 나누어 계산
+"""
+
+from typing import Tuple
+
+from .board import BOARD_SIZE, ROW_MASKS, FIRST_COL_MASK, LAST_COL_MASK
+
+try:
+    import numpy as np
+    from numba import njit, int64, uint64
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+_LOW_BITS = (1 << 64) - 1
+
+
+def _split(mask: int) -> Tuple[int, int]:
+    """81비트 마스크를 (하위 64비트, 상위 비트)로 분리"""
+    return mask & _LOW_BITS, mask >> 64
+
+
+if NUMBA_AVAILABLE:
+    _SHIFT_ROW = np.uint64(BOARD_SIZE)
+    _SHIFT_ROW_CARRY = np.uint64(64 - BOARD_SIZE)
+    _SHIFT_COL = np.uint64(1)
+    _SHIFT_COL_CARRY = np.uint64(63)
+
+    # 이동 가능한 셀 (첫 행/마지막 행/첫 열/마지막 열 제외) 마스크
+    _NOT_FIRST_ROW_LO, _NOT_FIRST_ROW_HI = (
+        np.uint64(part) for part in _split(((1 << 81) - 1) & ~ROW_MASKS[0])
+    )
+    _NOT_LAST_ROW_LO, _NOT_LAST_ROW_HI = (
+        np.uint64(part) for part in _split(((1 << 81) - 1) & ~ROW_MASKS[BOARD_SIZE - 1])
+    )
+    _NOT_FIRST_COL_LO, _NOT_FIRST_COL_HI = (
+        np.uint64(part) for part in _split(((1 << 81) - 1) & ~FIRST_COL_MASK)
+    )
+    _NOT_LAST_COL_LO, _NOT_LAST_COL_HI = (
+        np.uint64(part) for part in _split(((1 << 81) - 1) & ~LAST_COL_MASK)
+    )
+    _HI_BITS = np.uint64((1 << (BOARD_SIZE * BOARD_SIZE - 64)) - 1)
+
+    # 시그니처를 지정해 임포트 시점에 컴파일 (cache=True로 디스크에 저장되어 재시작 시 재사용)
+    @njit(int64(*([uint64] * 12)), cache=True)
+    def _distance_kernel(
+        start_lo, start_hi, goal_lo, goal_hi,
+        up_lo, up_hi, down_lo, down_hi,
+        left_lo, left_hi, right_lo, right_hi
+    ):
+        if (start_lo & goal_lo) | (start_hi & goal_hi):
+            return 0
+
+        reached_lo, reached_hi = start_lo, start_hi
+        frontier_lo, frontier_hi = start_lo, start_hi
+        distance = 0
+
+        while frontier_lo | frontier_hi:
+            distance += 1
+
+            # 위로 이동 (>> 9)
+            lo = frontier_lo & ~up_lo & _NOT_FIRST_ROW_LO
+            hi = frontier_hi & ~up_hi & _NOT_FIRST_ROW_HI
+            next_lo = (lo >> _SHIFT_ROW) | (hi << _SHIFT_ROW_CARRY)
+            next_hi = hi >> _SHIFT_ROW
+
+            # 아래로 이동 (<< 9)
+            lo = frontier_lo & ~down_lo & _NOT_LAST_ROW_LO
+            hi = frontier_hi & ~down_hi & _NOT_LAST_ROW_HI
+            next_lo |= lo << _SHIFT_ROW
+            next_hi |= (hi << _SHIFT_ROW) | (lo >> _SHIFT_ROW_CARRY)
+
+            # 왼쪽으로 이동 (>> 1)
+            lo = frontier_lo & ~left_lo & _NOT_FIRST_COL_LO
+            hi = frontier_hi & ~left_hi & _NOT_FIRST_COL_HI
+            next_lo |= (lo >> _SHIFT_COL) | (hi << _SHIFT_COL_CARRY)
+            next_hi |= hi >> _SHIFT_COL
+
+            # 오른쪽으로 이동 (<< 1)
+            lo = frontier_lo & ~right_lo & _NOT_LAST_COL_LO
+            hi = frontier_hi & ~right_hi & _NOT_LAST_COL_HI
+            next_lo |= lo << _SHIFT_COL
+            next_hi |= (hi << _SHIFT_COL) | (lo >> _SHIFT_COL_CARRY)
+
+            frontier_lo = next_lo & ~reached_lo
+            frontier_hi = next_hi & _HI_BITS & ~reached_hi
+
+            if (frontier_lo & goal_lo) | (frontier_hi & goal_hi):
+                return distance
+
+            reached_lo |= frontier_lo
+            reached_hi |= frontier_hi
+
+        return -1
+
+
+def get_distance(start_mask: int, goal_mask: int, blocked: Tuple[int, int, int, int]) -> int:
+    """
+    JIT 커널로 목표까지 최단 거리 계산 (NUMBA_AVAILABLE일 때만 호출)
+
+    Args:
+        start_mask: 시작 셀 비트마스크
+        goal_mask: 목표 행 비트마스크
+        blocked: 방향별 이동이 막힌 셀 비트마스크 (상, 하, 좌, 우)
+
+    Returns:
+        최단 거리 (경로 없으면 -1)
+    """
+    up, down, left, right = blocked
+    return _distance_kernel(
+        start_mask & _LOW_BITS, start_mask >> 64,
+        goal_mask & _LOW_BITS, goal_mask >> 64,
+        up & _LOW_BITS, up >> 64,
+        down & _LOW_BITS, down >> 64,
+        left & _LOW_BITS, left >> 64,
+        right & _LOW_BITS, right >> 64,
+    )
@@ -10,8 +10,14 @@ from typing import Tuple
 BOARD_SIZE = 9
 WALL_POSITIONS = 8
 
+# 비트보드 상수 (셀 (row, col) -> 비트 row * 9 + col)
+ALL_CELLS_MASK = (1 << (BOARD_SIZE * BOARD_SIZE)) - 1
+ROW_MASKS = tuple(((1 << BOARD_SIZE) - 1) << (row * BOARD_SIZE) for row in range(BOARD_SIZE))
+FIRST_COL_MASK = sum(1 << (row * BOARD_SIZE) for row in range(BOARD_SIZE))
+LAST_COL_MASK = FIRST_COL_MASK << (BOARD_SIZE - 1)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class Position:
     """보드 위치를 나타내는 불변 클래스"""
     row: int
@@ -24,6 +30,9 @@ class Position:
     def to_tuple(self) -> Tuple[int, int]:
         return (self.row, self.col)
 
+    def to_dict(self) -> dict:
+        return {"row": self.row, "col": self.col}
+
     @classmethod
     def from_tuple(cls, t: Tuple[int, int]) -> "Position":
         return cls(t[0], t[1])
@@ -71,7 +80,55 @@ class Board:
         """두 위치 사이의 방향 벡터 반환"""
         return (to_pos.row - from_pos.row, to_pos.col - from_pos.col)
 
+    # ===== 비트보드 연산 =====
+
+    @staticmethod
+    def cell_mask(row: int, col: int) -> int:
+        """셀 하나의 비트마스크"""
+        return 1 << (row * BOARD_SIZE + col)
+
+    @staticmethod
+    def row_mask(row: int) -> int:
+        """한 행 전체의 비트마스크"""
+        return ROW_MASKS[row]
+
+    @staticmethod
+    def expand_cells(cells: int, blocked: Tuple[int, int, int, int]) -> int:
+        """
+        셀 집합에서 한 칸 이동으로 도달 가능한 셀 집합 반환
+
+        Args:
+            cells: 출발 셀 비트마스크
+            blocked: 방향별 이동이 막힌 셀 비트마스크 (상, 하, 좌, 우 - DIRECTIONS 순서)
+        """
+        up, down, left, right = blocked
+        return (
+            ((cells & ~up & ~ROW_MASKS[0]) >> BOARD_SIZE)
+            | (((cells & ~down & ~ROW_MASKS[BOARD_SIZE - 1]) << BOARD_SIZE) & ALL_CELLS_MASK)
+            | ((cells & ~left & ~FIRST_COL_MASK) >> 1)
+            | ((cells & ~right & ~LAST_COL_MASK) << 1)
+        )
+
 
 # 클래스 정의 후 시작 위치 설정
 Board.PLAYER1_START = Position(8, 4)  # 하단 중앙
 Board.PLAYER2_START = Position(0, 4)  # 상단 중앙
+
+
+# ===== 고정 보드용 사전 계산 테이블 (셀 인덱스 = row * 9 + col) =====
+
+# 셀 인덱스별 위치 객체
+CELL_POSITIONS = tuple(
+    Position(row, col) for row in range(BOARD_SIZE) for col in range(BOARD_SIZE)
+)
+
+# 셀 인덱스별 이웃 ((방향 인덱스, 이웃 셀 인덱스), ...) - 방향은 Board.DIRECTIONS 순서 (상, 하, 좌, 우)
+NEIGHBORS = tuple(
+    tuple(
+        (direction, (row + dr) * BOARD_SIZE + col + dc)
+        for direction, (dr, dc) in enumerate(Board.DIRECTIONS)
+        if Board.is_valid_cell(row + dr, col + dc)
+    )
+    for row in range(BOARD_SIZE)
+    for col in range(BOARD_SIZE)
+)
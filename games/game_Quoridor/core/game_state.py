@@ -14,6 +14,7 @@ from .player import Player
 from .wall import Wall, WallManager, Orientation
 from .move_validator import MoveValidator
 from .pathfinder import Pathfinder
+from . import zobrist
 
 
 class GameStatus(Enum):
@@ -24,6 +25,10 @@ class GameStatus(Enum):
     ABANDONED = "abandoned"
 
 
+# 승패가 결정된 상태 (탐색 중 노드마다 검사하므로 튜플을 매번 만들지 않도록 상수로 유지)
+FINISHED_STATUSES = (GameStatus.PLAYER1_WIN, GameStatus.PLAYER2_WIN)
+
+
 class GameMode(Enum):
     """게임 모드"""
     VS_AI = "vs_ai"
@@ -36,7 +41,7 @@ class ActionType(Enum):
     WALL = "wall"
 
 
-@dataclass
+@dataclass(slots=True)
 class Action:
     """게임 액션"""
     action_type: ActionType
@@ -58,6 +63,13 @@ class Action:
 class GameState:
     """쿼리도 게임 상태 관리"""
 
+    # AI 탐색 중 노드마다 copy()되므로 인스턴스 딕셔너리 없이 고정 속성만 사용
+    __slots__ = (
+        "game_id", "status", "current_turn", "turn_count", "winner", "game_mode",
+        "player1", "player2", "wall_manager", "created_at", "updated_at",
+        "_version", "_dict_cache", "_dist_fields", "_zobrist_key",
+    )
+
     def __init__(
         self,
         game_id: Optional[str] = None,
@@ -83,6 +95,34 @@ class GameState:
         self.created_at = datetime.utcnow()
         self.updated_at = datetime.utcnow()
 
+        # 상태 변경 버전 (to_dict 결과 캐시 무효화용)
+        self._version = 0
+        self._dict_cache: Optional[dict] = None
+
+        # 목표 행별 거리 필드 캐시 (벽이 바뀔 때만 무효화)
+        self._dist_fields: dict[int, list[int]] = {}
+
+        # 상태 해시 키 (수마다 증분 갱신)
+        self._zobrist_key = zobrist.compute_key(
+            self.player1, self.player2, self.wall_manager.walls, self.current_turn
+        )
+
+    @property
+    def version(self) -> int:
+        """상태가 변경될 때마다 증가하는 버전"""
+        return self._version
+
+    @property
+    def zobrist_key(self) -> int:
+        """폰 위치, 벽, 남은 벽 수, 차례로 결정되는 64비트 해시 키"""
+        return self._zobrist_key
+
+    def _mark_changed(self) -> None:
+        """상태 변경 기록 (버전 증가 및 직렬화 캐시 무효화)"""
+        self._version += 1
+        self._dict_cache = None
+        self.updated_at = datetime.utcnow()
+
     @property
     def current_player(self) -> Player:
         """현재 턴인 플레이어 반환"""
@@ -93,6 +133,18 @@ class GameState:
         """상대 플레이어 반환"""
         return self.player2 if self.current_turn == 1 else self.player1
 
+    def compute_dist_field(self, goal_row: int) -> list[int]:
+        """
+        모든 셀에서 goal_row까지의 최단 거리 (row * 9 + col 인덱스, 도달 불가 -1)
+
+        거리는 벽 배치에만 의존하므로 벽이 설치될 때까지 캐시됨
+        """
+        field = self._dist_fields.get(goal_row)
+        if field is None:
+            field = Pathfinder.get_distance_field(goal_row, self.wall_manager.block_masks)
+            self._dist_fields[goal_row] = field
+        return field
+
     def get_valid_pawn_moves(self) -> list[Position]:
         """현재 플레이어의 유효한 폰 이동 목록"""
         return MoveValidator.get_valid_pawn_moves(
@@ -120,7 +172,7 @@ class GameState:
         Returns:
             (성공 여부, 메시지)
         """
-        if self.status in (GameStatus.PLAYER1_WIN, GameStatus.PLAYER2_WIN):
+        if self.status in FINISHED_STATUSES:
             return False, "Game is already finished"
 
         try:
@@ -137,8 +189,13 @@ class GameState:
             return False, "Invalid move"
 
         # 이동 수행
-        self.current_player.move_to(target)
-        self.updated_at = datetime.utcnow()
+        player = self.current_player
+        self._zobrist_key ^= (
+            zobrist.pawn_key(player.player_id, player.position)
+            ^ zobrist.pawn_key(player.player_id, target)
+        )
+        player.move_to(target)
+        self._mark_changed()
 
         # 승리 확인
         if self.current_player.has_reached_goal():
@@ -163,7 +220,7 @@ class GameState:
         Returns:
             (성공 여부, 메시지)
         """
-        if self.status in (GameStatus.PLAYER1_WIN, GameStatus.PLAYER2_WIN):
+        if self.status in FINISHED_STATUSES:
             return False, "Game is already finished"
 
         if not self.current_player.has_walls():
@@ -184,9 +241,16 @@ class GameState:
             return False, "Invalid wall placement"
 
         # 벽 설치
+        player = self.current_player
         self.wall_manager.add_wall(wall)
-        self.current_player.use_wall()
-        self.updated_at = datetime.utcnow()
+        self._zobrist_key ^= (
+            zobrist.wall_key(wall)
+            ^ zobrist.walls_remaining_key(player.player_id, player.walls_remaining)
+        )
+        player.use_wall()
+        self._zobrist_key ^= zobrist.walls_remaining_key(player.player_id, player.walls_remaining)
+        self._dist_fields = {}
+        self._mark_changed()
 
         # 턴 전환
         self._switch_turn()
@@ -197,6 +261,7 @@ class GameState:
         """턴 전환"""
         self.current_turn = 2 if self.current_turn == 1 else 1
         self.turn_count += 1
+        self._zobrist_key ^= zobrist.TURN_KEY
 
     def get_player_distance_to_goal(self, player_id: int) -> int:
         """플레이어의 목표까지 최단 거리"""
@@ -221,10 +286,25 @@ class GameState:
         new_state.wall_manager = self.wall_manager.copy()
         new_state.created_at = self.created_at
         new_state.updated_at = self.updated_at
+        new_state._version = self._version
+        new_state._dict_cache = self._dict_cache
+        new_state._zobrist_key = self._zobrist_key
+        # 벽이 같은 동안은 거리 필드를 공유 (벽 설치 시 새 딕셔너리로 교체됨)
+        new_state._dist_fields = self._dist_fields
         return new_state
 
     def to_dict(self) -> dict:
-        """게임 상태를 딕셔너리로 변환"""
+        """
+        게임 상태를 딕셔너리로 변환
+
+        상태가 바뀌기 전까지는 같은 딕셔너리를 재사용하므로 반환값을 수정하지 말 것
+        """
+        if self._dict_cache is None:
+            self._dict_cache = self._build_dict()
+        return self._dict_cache
+
+    def _build_dict(self) -> dict:
+        """게임 상태 딕셔너리 생성"""
         return {
             "game_id": self.game_id,
             "status": self.status.value,
@@ -232,26 +312,10 @@ class GameState:
             "current_turn": self.current_turn,
             "turn_count": self.turn_count,
             "players": {
-                "player1": {
-                    "name": self.player1.name,
-                    "position": {
-                        "row": self.player1.position.row,
-                        "col": self.player1.position.col
-                    },
-                    "walls_remaining": self.player1.walls_remaining,
-                    "goal_row": self.player1.goal_row
-                },
-                "player2": {
-                    "name": self.player2.name,
-                    "position": {
-                        "row": self.player2.position.row,
-                        "col": self.player2.position.col
-                    },
-                    "walls_remaining": self.player2.walls_remaining,
-                    "goal_row": self.player2.goal_row
-                }
+                "player1": self.player1.to_dict(),
+                "player2": self.player2.to_dict()
             },
-            "walls": [wall.to_dict() for wall in self.wall_manager.walls],
+            "walls": self.wall_manager.to_dict_list(),
             "winner": self.winner,
             "created_at": self.created_at.isoformat() + "Z",
             "updated_at": self.updated_at.isoformat() + "Z"
@@ -302,4 +366,11 @@ class GameState:
         game.created_at = datetime.fromisoformat(data["created_at"].rstrip("Z"))
         game.updated_at = datetime.fromisoformat(data["updated_at"].rstrip("Z"))
 
+        game._version = 0
+        game._dict_cache = None
+        game._dist_fields = {}
+        game._zobrist_key = zobrist.compute_key(
+            game.player1, game.player2, game.wall_manager.walls, game.current_turn
+        )
+
         return game
@@ -7,7 +7,7 @@ from typing import Optional
 
 from .board import Board, Position
 from .player import Player
-from .wall import Wall, WallManager, Orientation
+from .wall import Wall, WallManager, ALL_WALLS
 from .pathfinder import Pathfinder
 
 
@@ -149,20 +149,45 @@ class MoveValidator:
         if not player.has_walls():
             return []
 
+        # 현재 최단 경로가 지나는 간선 (이 간선을 막지 않는 벽은 경로를 끊을 수 없음)
+        path_edges = MoveValidator._get_path_edges(
+            player.position, player.goal_row, wall_manager
+        ) | MoveValidator._get_path_edges(
+            opponent.position, opponent.goal_row, wall_manager
+        )
+
         valid_walls = []
 
-        for row in range(Board.WALL_POSITIONS):
-            for col in range(Board.WALL_POSITIONS):
-                for orientation in Orientation:
-                    wall = Wall(row, col, orientation)
+        for wall in ALL_WALLS:
+            if not wall_manager.can_place_wall(wall):
+                continue
+
+            # 최단 경로와 겹치는 벽만 BFS로 경로 보장 확인
+            crosses_path = bool(wall.get_blocked_edges() & path_edges)
+            if crosses_path and not MoveValidator.is_valid_wall_placement(
+                wall, player, opponent, wall_manager
+            ):
+                continue
 
-                    if MoveValidator.is_valid_wall_placement(
-                        wall, player, opponent, wall_manager
-                    ):
-                        valid_walls.append(wall)
+            valid_walls.append(wall)
 
         return valid_walls
 
+    @staticmethod
+    def _get_path_edges(
+        start: Position,
+        goal_row: int,
+        wall_manager: WallManager
+    ) -> set[tuple[tuple[int, int], tuple[int, int]]]:
+        """최단 경로가 지나는 간선 집합 (진행 방향 기준)"""
+        path = Pathfinder.find_shortest_path(start, goal_row, wall_manager)
+        if not path:
+            return set()
+        return {
+            (path[i].to_tuple(), path[i + 1].to_tuple())
+            for i in range(len(path) - 1)
+        }
+
     @staticmethod
     def is_valid_wall_placement(
         wall: Wall,
@@ -190,14 +215,8 @@ class MoveValidator:
         if not wall_manager.can_place_wall(wall):
             return False
 
-        # 3. 경로 보장 확인 (임시로 벽 설치 후 검사)
-        temp_manager = wall_manager.copy()
-        temp_manager.add_wall(wall)
-
-        return Pathfinder.can_place_wall_safely(
-            temp_manager,
-            player.position,
-            player.goal_row,
-            opponent.position,
-            opponent.goal_row
-        )
+        # 3. 경로 보장 확인 (벽을 추가한 차단 비트마스크로 검사, 벽 관리자 복사 없음)
+        blocked = wall_manager.block_masks_with(wall)
+        if Pathfinder.get_distance_bitboard(player.position, player.goal_row, blocked) < 0:
+            return False
+        return Pathfinder.get_distance_bitboard(opponent.position, opponent.goal_row, blocked) >= 0
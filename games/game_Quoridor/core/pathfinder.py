@@ -4,10 +4,11 @@ BFS를 이용한 경로 검증
 """
 
 from collections import deque
-from typing import Optional, Set
+from typing import Optional, Tuple
 
-from .board import Board, Position
+from .board import Board, Position, CELL_POSITIONS, NEIGHBORS
 from .wall import WallManager
+from . import bitboard_jit
 
 
 class Pathfinder:
@@ -35,35 +36,103 @@ class Pathfinder:
         if start.row == goal_row:
             return [start]
 
-        visited: Set[tuple] = {start.to_tuple()}
-        queue = deque([(start, [start])])
+        # 셀 인덱스 기반 BFS (방문 표시는 bytearray, 경로는 부모 인덱스로 복원)
+        blocked = wall_manager.block_masks
+        start_cell = start.row * Board.SIZE + start.col
+        visited = bytearray(Board.SIZE * Board.SIZE)
+        visited[start_cell] = 1
+        parent = [-1] * (Board.SIZE * Board.SIZE)
+        queue = deque([start_cell])
 
         while queue:
-            current, path = queue.popleft()
+            cell = queue.popleft()
 
-            for dr, dc in Board.DIRECTIONS:
-                new_row, new_col = current.row + dr, current.col + dc
-
-                if not Board.is_valid_cell(new_row, new_col):
+            for direction, neighbor in NEIGHBORS[cell]:
+                if visited[neighbor] or (blocked[direction] >> cell) & 1:
                     continue
 
-                new_pos = Position(new_row, new_col)
+                visited[neighbor] = 1
+                parent[neighbor] = cell
 
-                if new_pos.to_tuple() in visited:
-                    continue
+                if neighbor // Board.SIZE == goal_row:
+                    path = []
+                    while neighbor != -1:
+                        path.append(CELL_POSITIONS[neighbor])
+                        neighbor = parent[neighbor]
+                    path.reverse()
+                    return path
 
-                if wall_manager.is_move_blocked(current, new_pos):
-                    continue
+                queue.append(neighbor)
 
-                new_path = path + [new_pos]
+        return None
 
-                if new_row == goal_row:
-                    return new_path
+    @staticmethod
+    def get_distance_bitboard(
+        start: Position,
+        goal_row: int,
+        blocked: Tuple[int, int, int, int]
+    ) -> int:
+        """
+        비트보드 BFS로 목표 행까지의 최단 거리 계산 (한 단계에 BFS 레이어 전체를 확장)
 
-                visited.add(new_pos.to_tuple())
-                queue.append((new_pos, new_path))
+        Args:
+            start: 시작 위치
+            goal_row: 목표 행
+            blocked: 방향별 이동이 막힌 셀 비트마스크 (WallManager.block_masks)
 
-        return None
+        Returns:
+            최단 거리 (경로 없으면 -1)
+        """
+        reached = Board.cell_mask(start.row, start.col)
+        goal = Board.row_mask(goal_row)
+
+        # numba가 설치되어 있으면 JIT 커널 사용
+        if bitboard_jit.NUMBA_AVAILABLE:
+            return bitboard_jit.get_distance(reached, goal, blocked)
+
+        if reached & goal:
+            return 0
+
+        frontier = reached
+        distance = 0
+        while frontier:
+            distance += 1
+            frontier = Board.expand_cells(frontier, blocked) & ~reached
+            if frontier & goal:
+                return distance
+            reached |= frontier
+
+        return -1
+
+    @staticmethod
+    def get_distance_field(goal_row: int, blocked: Tuple[int, int, int, int]) -> list[int]:
+        """
+        목표 행 전체에서 시작하는 다중 시작점 BFS로 모든 셀의 목표까지 거리 계산
+
+        Args:
+            goal_row: 목표 행
+            blocked: 방향별 이동이 막힌 셀 비트마스크 (WallManager.block_masks)
+
+        Returns:
+            row * 9 + col 인덱스별 거리 리스트 (도달 불가 셀은 -1)
+        """
+        # 벽은 양방향을 막으므로 목표에서 거꾸로 확장해도 거리는 같음
+        field = [-1] * (Board.SIZE * Board.SIZE)
+        frontier = Board.row_mask(goal_row)
+        reached = frontier
+        distance = 0
+
+        while frontier:
+            cells = frontier
+            while cells:
+                lowest = cells & -cells
+                field[lowest.bit_length() - 1] = distance
+                cells ^= lowest
+            distance += 1
+            frontier = Board.expand_cells(frontier, blocked) & ~reached
+            reached |= frontier
+
+        return field
 
     @staticmethod
     def has_path_to_goal(
@@ -72,7 +141,7 @@ class Pathfinder:
         wall_manager: WallManager
     ) -> bool:
         """목표까지 경로가 존재하는지 확인"""
-        return Pathfinder.find_shortest_path(start, goal_row, wall_manager) is not None
+        return Pathfinder.get_distance_bitboard(start, goal_row, wall_manager.block_masks) >= 0
 
     @staticmethod
     def get_shortest_distance(
@@ -81,10 +150,7 @@ class Pathfinder:
         wall_manager: WallManager
     ) -> int:
         """목표까지의 최단 거리 반환 (경로 없으면 -1)"""
-        path = Pathfinder.find_shortest_path(start, goal_row, wall_manager)
-        if path is None:
-            return -1
-        return len(path) - 1  # 시작 위치 제외
+        return Pathfinder.get_distance_bitboard(start, goal_row, wall_manager.block_masks)
 
     @staticmethod
     def can_place_wall_safely(
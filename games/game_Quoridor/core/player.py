@@ -9,7 +9,7 @@ from typing import Optional
 from .board import Position, Board
 
 
-@dataclass
+@dataclass(slots=True)
 class Player:
     """플레이어 클래스"""
 
@@ -47,6 +47,15 @@ class Player:
         """목표에 도달했는지 확인"""
         return self.position.row == self.goal_row
 
+    def to_dict(self) -> dict:
+        """딕셔너리로 변환 (player_id 제외, GameState.to_dict의 players 항목)"""
+        return {
+            "name": self.name,
+            "position": self.position.to_dict(),
+            "walls_remaining": self.walls_remaining,
+            "goal_row": self.goal_row
+        }
+
     def copy(self) -> "Player":
         """플레이어 상태 복사"""
         return Player(
@@ -5,7 +5,7 @@ Wall Module
 
 from dataclasses import dataclass
 from enum import Enum
-from typing import Set, Tuple
+from typing import FrozenSet, Set, Tuple
 
 from .board import Board, Position
 
@@ -16,7 +16,7 @@ class Orientation(Enum):
     VERTICAL = "vertical"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Wall:
     """벽 클래스 (불변)"""
 
@@ -28,8 +28,19 @@ class Wall:
         if not Board.is_valid_wall_position(self.row, self.col):
             raise ValueError(f"Invalid wall position: ({self.row}, {self.col})")
 
-    def get_blocked_edges(self) -> Set[Tuple[Tuple[int, int], Tuple[int, int]]]:
+    def get_blocked_edges(self) -> FrozenSet[Tuple[Tuple[int, int], Tuple[int, int]]]:
         """이 벽이 차단하는 셀 간 이동 경로 반환"""
+        return WALL_BLOCKED_EDGES[(self.row, self.col, self.orientation)]
+
+    def get_block_masks(self) -> Tuple[int, int, int, int]:
+        """이 벽이 이동을 막는 셀 비트마스크 (상, 하, 좌, 우 방향별)"""
+        return WALL_BLOCK_MASKS[(self.row, self.col, self.orientation)]
+
+    def get_occupied_slots(self) -> FrozenSet[Tuple[int, int, str]]:
+        """이 벽이 차지하는 슬롯 반환 (교차 검사용)"""
+        return WALL_OCCUPIED_SLOTS[(self.row, self.col, self.orientation)]
+
+    def _compute_blocked_edges(self) -> Set[Tuple[Tuple[int, int], Tuple[int, int]]]:
         blocked = set()
 
         if self.orientation == Orientation.HORIZONTAL:
@@ -51,8 +62,19 @@ class Wall:
 
         return blocked
 
-    def get_occupied_slots(self) -> Set[Tuple[int, int, str]]:
-        """이 벽이 차지하는 슬롯 반환 (교차 검사용)"""
+    def _compute_block_masks(self) -> Tuple[int, int, int, int]:
+        if self.orientation == Orientation.HORIZONTAL:
+            # 위쪽 셀들은 아래로, 아래쪽 셀들은 위로 이동 불가
+            top = Board.cell_mask(self.row, self.col) | Board.cell_mask(self.row, self.col + 1)
+            bottom = Board.cell_mask(self.row + 1, self.col) | Board.cell_mask(self.row + 1, self.col + 1)
+            return (bottom, top, 0, 0)
+
+        # 왼쪽 셀들은 오른쪽으로, 오른쪽 셀들은 왼쪽으로 이동 불가
+        left = Board.cell_mask(self.row, self.col) | Board.cell_mask(self.row + 1, self.col)
+        right = Board.cell_mask(self.row, self.col + 1) | Board.cell_mask(self.row + 1, self.col + 1)
+        return (0, 0, right, left)
+
+    def _compute_occupied_slots(self) -> Set[Tuple[int, int, str]]:
         slots = set()
 
         if self.orientation == Orientation.HORIZONTAL:
@@ -94,24 +116,80 @@ class Wall:
         )
 
 
+# ===== 고정 보드용 사전 계산 테이블 (임포트 시 한 번만 계산) =====
+
+# 설치 가능한 모든 벽 위치 (row, col, 방향 순)
+ALL_WALLS = tuple(
+    Wall(row, col, orientation)
+    for row in range(Board.WALL_POSITIONS)
+    for col in range(Board.WALL_POSITIONS)
+    for orientation in Orientation
+)
+
+# (row, col, orientation) -> 차단 간선 / 차단 비트마스크 / 점유 슬롯
+WALL_BLOCKED_EDGES = {
+    (wall.row, wall.col, wall.orientation): frozenset(wall._compute_blocked_edges())
+    for wall in ALL_WALLS
+}
+WALL_BLOCK_MASKS = {
+    (wall.row, wall.col, wall.orientation): wall._compute_block_masks()
+    for wall in ALL_WALLS
+}
+WALL_OCCUPIED_SLOTS = {
+    (wall.row, wall.col, wall.orientation): frozenset(wall._compute_occupied_slots())
+    for wall in ALL_WALLS
+}
+
+
 class WallManager:
     """벽 관리 클래스"""
 
+    __slots__ = ("_walls", "_blocked_edges", "_occupied_slots", "_block_masks", "_dict_list")
+
     def __init__(self):
         self._walls: list[Wall] = []
         self._blocked_edges: Set[Tuple[Tuple[int, int], Tuple[int, int]]] = set()
         self._occupied_slots: Set[Tuple[int, int, str]] = set()
+        # 방향별 이동이 막힌 셀 비트마스크 (상, 하, 좌, 우)
+        self._block_masks: Tuple[int, int, int, int] = (0, 0, 0, 0)
+        # to_dict_list 결과 (앞쪽 벽부터의 일부일 수 있음, 복사본끼리 공유하므로 제자리 수정하지 않고 새 리스트로 교체)
+        self._dict_list: list[dict] = []
 
     @property
     def walls(self) -> list[Wall]:
         return self._walls.copy()
 
+    @property
+    def block_masks(self) -> Tuple[int, int, int, int]:
+        """방향별 이동이 막힌 셀 비트마스크 (상, 하, 좌, 우)"""
+        return self._block_masks
+
+    def to_dict_list(self) -> list[dict]:
+        """
+        설치된 벽 목록을 설치 순서대로 딕셔너리 리스트로 변환
+
+        벽이 바뀌기 전까지는 같은 리스트를 재사용하므로 반환값을 수정하지 말 것
+        """
+        # 마지막 변환 이후 추가된 벽만 변환 (AI 탐색 중 벽 설치에는 비용을 더하지 않음)
+        converted = len(self._dict_list)
+        if converted < len(self._walls):
+            self._dict_list = self._dict_list + [wall.to_dict() for wall in self._walls[converted:]]
+        return self._dict_list
+
+    def block_masks_with(self, wall: Wall) -> Tuple[int, int, int, int]:
+        """벽을 하나 더 설치했을 때의 차단 비트마스크 (실제 설치는 하지 않음)"""
+        return tuple(
+            current | added
+            for current, added in zip(self._block_masks, wall.get_block_masks())
+        )
+
     def add_wall(self, wall: Wall) -> bool:
         """벽 추가 (성공 시 True)"""
         if self.can_place_wall(wall):
             self._walls.append(wall)
             self._blocked_edges.update(wall.get_blocked_edges())
             self._occupied_slots.update(wall.get_occupied_slots())
+            self._block_masks = self.block_masks_with(wall)
             return True
         return False
 
@@ -130,12 +208,22 @@ class WallManager:
             wall = self._walls.pop()
             self._blocked_edges -= wall.get_blocked_edges()
             self._occupied_slots -= wall.get_occupied_slots()
+            # 벽끼리는 같은 간선을 막을 수 없으므로 해당 비트만 제거
+            self._block_masks = tuple(
+                current & ~removed
+                for current, removed in zip(self._block_masks, wall.get_block_masks())
+            )
+            if len(self._dict_list) > len(self._walls):
+                self._dict_list = self._dict_list[:len(self._walls)]
             return wall
         return None
 
     def copy(self) -> "WallManager":
         """깊은 복사"""
         new_manager = WallManager()
-        for wall in self._walls:
-            new_manager.add_wall(wall)
+        new_manager._walls = self._walls.copy()
+        new_manager._blocked_edges = self._blocked_edges.copy()
+        new_manager._occupied_slots = self._occupied_slots.copy()
+        new_manager._block_masks = self._block_masks
+        new_manager._dict_list = self._dict_list
         return new_manager
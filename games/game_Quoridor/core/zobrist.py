@@ -0,0 +1,65 @@
+"""
+Zobrist Module
+게임 상태 해시 키 (AI 전치표용)
+"""
+
+import random
+
+from .board import Board, Position, BOARD_SIZE, WALL_POSITIONS
+from .player import Player
+from .wall import Wall, Orientation
+
+
+# 고정 시드 (프로세스가 달라도 같은 상태는 같은 키)
+_rng = random.Random(0x9E3779B9)
+
+# 플레이어별 폰 위치 키 [player_id][row * 9 + col]
+PAWN_KEYS = {
+    player_id: [_rng.getrandbits(64) for _ in range(BOARD_SIZE * BOARD_SIZE)]
+    for player_id in (1, 2)
+}
+
+# 벽 슬롯 키 (row, col, orientation)
+WALL_KEYS = {
+    (row, col, orientation): _rng.getrandbits(64)
+    for row in range(WALL_POSITIONS)
+    for col in range(WALL_POSITIONS)
+    for orientation in Orientation
+}
+
+# 플레이어별 남은 벽 수 키 [player_id][count]
+WALLS_REMAINING_KEYS = {
+    player_id: [_rng.getrandbits(64) for _ in range(Player.INITIAL_WALLS + 1)]
+    for player_id in (1, 2)
+}
+
+# 플레이어 2 차례일 때 XOR
+TURN_KEY = _rng.getrandbits(64)
+
+
+def pawn_key(player_id: int, position: Position) -> int:
+    return PAWN_KEYS[player_id][position.row * Board.SIZE + position.col]
+
+
+def wall_key(wall: Wall) -> int:
+    return WALL_KEYS[(wall.row, wall.col, wall.orientation)]
+
+
+def walls_remaining_key(player_id: int, count: int) -> int:
+    return WALLS_REMAINING_KEYS[player_id][count]
+
+
+def compute_key(
+    player1: Player,
+    player2: Player,
+    walls: list[Wall],
+    current_turn: int
+) -> int:
+    """상태 전체로부터 키 계산 (이후에는 수마다 증분 갱신)"""
+    key = TURN_KEY if current_turn == 2 else 0
+    for player in (player1, player2):
+        key ^= pawn_key(player.player_id, player.position)
+        key ^= walls_remaining_key(player.player_id, player.walls_remaining)
+    for wall in walls:
+        key ^= wall_key(wall)
+    return key
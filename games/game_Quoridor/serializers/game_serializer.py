@@ -4,10 +4,22 @@ Game Serializer Module
 """
 
 import json
+import struct
+from datetime import datetime
 from typing import Optional, List
 from dataclasses import dataclass
 
-from ..core.game_state import GameState
+from ..core.board import BOARD_SIZE, WALL_POSITIONS
+from ..core.game_state import GameState, GameStatus
+
+
+# 압축 상태 형식: 헤더 9바이트 + 설치된 벽마다 1바이트 (설치 순서 유지)
+# 헤더 = P1 셀, P2 셀, P1 남은 벽, P2 남은 벽, 현재 턴, 상태 인덱스, 승자(0=없음), 턴 수
+# 셀 = row * 9 + col, 벽 = (row * 8 + col) * 2 + (0=수평, 1=수직)
+_STATE_HEADER = struct.Struct("<7BH")
+_ORIENTATIONS = ("horizontal", "vertical")
+_STATUSES = tuple(status.value for status in GameStatus)
+_STATUS_INDEXES = {status: index for index, status in enumerate(_STATUSES)}
 
 
 @dataclass
@@ -19,6 +31,7 @@ class MoveRecord:
     row: int
     col: int
     orientation: Optional[str] = None  # wall일 때만
+    created_at: Optional[str] = None  # 기록 시간 (ISO 형식)
 
     def to_dict(self) -> dict:
         result = {
@@ -30,6 +43,8 @@ class MoveRecord:
         }
         if self.orientation:
             result["orientation"] = self.orientation
+        if self.created_at:
+            result["created_at"] = self.created_at
         return result
 
     @classmethod
@@ -40,7 +55,8 @@ class MoveRecord:
             action_type=data["action_type"],
             row=data["row"],
             col=data["col"],
-            orientation=data.get("orientation")
+            orientation=data.get("orientation"),
+            created_at=data.get("created_at")
         )
 
 
@@ -116,6 +132,75 @@ class GameSerializer:
         with open(filepath, "r", encoding="utf-8") as f:
             return GameSerializer.from_json(f.read())
 
+    @staticmethod
+    def state_to_bits(state: dict) -> bytes:
+        """
+        게임 상태 딕셔너리를 바이트로 압축 (리플레이 키프레임 저장용, 최대 29바이트)
+
+        게임 ID, 플레이어 이름, 모드, 시각 같은 메타데이터는 포함하지 않음
+        """
+        player1 = state["players"]["player1"]
+        player2 = state["players"]["player2"]
+        header = _STATE_HEADER.pack(
+            player1["position"]["row"] * BOARD_SIZE + player1["position"]["col"],
+            player2["position"]["row"] * BOARD_SIZE + player2["position"]["col"],
+            player1["walls_remaining"],
+            player2["walls_remaining"],
+            state["current_turn"],
+            _STATUS_INDEXES[state["status"]],
+            state["winner"] or 0,
+            state["turn_count"]
+        )
+        walls = bytes(
+            (wall["row"] * WALL_POSITIONS + wall["col"]) * 2
+            + (wall["orientation"] == "vertical")
+            for wall in state["walls"]
+        )
+        return header + walls
+
+    @staticmethod
+    def state_from_bits(data: bytes, base_state: dict) -> dict:
+        """
+        압축 상태를 게임 상태 딕셔너리로 복원
+
+        Args:
+            data: state_to_bits 결과
+            base_state: 메타데이터(게임 ID, 이름, 모드, 시각, 목표 행)를 가져올 상태 (예: 초기 상태)
+
+        Returns:
+            새 상태 딕셔너리
+        """
+        (
+            cell1, cell2, walls1, walls2, current_turn, status, winner, turn_count
+        ) = _STATE_HEADER.unpack_from(data)
+
+        walls = []
+        for code in data[_STATE_HEADER.size:]:
+            row, col = divmod(code >> 1, WALL_POSITIONS)
+            walls.append({"row": row, "col": col, "orientation": _ORIENTATIONS[code & 1]})
+
+        players = base_state["players"]
+        return {
+            **base_state,
+            "status": _STATUSES[status],
+            "current_turn": current_turn,
+            "turn_count": turn_count,
+            "players": {
+                "player1": {
+                    **players["player1"],
+                    "position": {"row": cell1 // BOARD_SIZE, "col": cell1 % BOARD_SIZE},
+                    "walls_remaining": walls1
+                },
+                "player2": {
+                    **players["player2"],
+                    "position": {"row": cell2 // BOARD_SIZE, "col": cell2 % BOARD_SIZE},
+                    "walls_remaining": walls2
+                }
+            },
+            "walls": walls,
+            "winner": winner or None
+        }
+
     # ===== 리플레이 관련 메서드 =====
 
     @staticmethod
@@ -215,3 +300,32 @@ class GameSerializer:
             state = GameSerializer.apply_move_to_state(state, move)
 
         return state
+
+    @staticmethod
+    def replay_moves(state: dict, moves: List[MoveRecord]) -> dict:
+        """
+        실제 게임 로직으로 수를 순서대로 적용하여 상태 재구성
+        (키프레임 스냅샷 + 이후 수 기록으로 중간 상태 복원용)
+
+        Args:
+            state: 기준 상태 (키프레임 스냅샷 또는 초기 상태)
+            moves: 기준 상태 이후의 수 목록 (순서대로)
+
+        Returns:
+            모든 수를 적용한 후의 게임 상태
+        """
+        game = GameState.from_dict(state)
+
+        for move in moves:
+            if move.action_type == "move":
+                success, message = game.move_pawn(move.row, move.col)
+            else:
+                success, message = game.place_wall(move.row, move.col, move.orientation)
+
+            if not success:
+                raise ValueError(f"Cannot replay step {move.step_no}: {message}")
+
+            if move.created_at:
+                game.updated_at = datetime.fromisoformat(move.created_at.rstrip("Z"))
+
+        return game.to_dict()
@@ -0,0 +1,4 @@
+"""
+Quoridor Tests
+게임 엔진 / AI 회귀 테스트
+"""
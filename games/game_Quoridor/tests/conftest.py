@@ -0,0 +1,51 @@
+"""
+공용 픽스처
+"""
+
+import random
+
+import pytest
+
+from ..core.game_state import GameState, FINISHED_STATUSES
+from ..core import bitboard_jit
+
+
+def play_random_game(seed: int, max_turns: int = 120) -> list[GameState]:
+    """
+    시드 고정 랜덤 대국을 두고 각 수 직후의 상태 복사본 목록 반환
+
+    벽 설치 비율을 높여 벽이 많은 국면도 포함되도록 함
+    """
+    rng = random.Random(seed)
+    game = GameState(game_id=f"game-{seed}")
+    states = [game.copy()]
+
+    while game.status not in FINISHED_STATUSES and game.turn_count < max_turns:
+        walls = game.get_valid_wall_placements() if game.current_player.has_walls() else []
+        if walls and rng.random() < 0.4:
+            wall = rng.choice(walls)
+            ok, message = game.place_wall(wall.row, wall.col, wall.orientation.value)
+        else:
+            move = rng.choice(game.get_valid_pawn_moves())
+            ok, message = game.move_pawn(move.row, move.col)
+        assert ok, message
+        states.append(game.copy())
+
+    return states
+
+
+@pytest.fixture(scope="session")
+def random_states() -> list[GameState]:
+    """여러 랜덤 대국의 모든 국면"""
+    return [state for seed in range(8) for state in play_random_game(seed)]
+
+
+@pytest.fixture(params=["python", "numba"])
+def bitboard_backend(request, monkeypatch):
+    """비트보드 BFS를 순수 파이썬 / numba 커널 양쪽으로 실행"""
+    if request.param == "numba":
+        if not bitboard_jit.NUMBA_AVAILABLE:
+            pytest.skip("numba not installed")
+    else:
+        monkeypatch.setattr(bitboard_jit, "NUMBA_AVAILABLE", False)
+    return request.param
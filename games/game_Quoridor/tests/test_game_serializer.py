@@ -0,0 +1,46 @@
+"""
+GameSerializer 테스트 (키프레임 압축 / 복원)
+"""
+
+from ..core.board import Position
+from ..core.game_state import GameState
+from ..serializers import GameSerializer
+
+
+def _without_timestamps(state: dict) -> dict:
+    return {key: value for key, value in state.items() if key not in ("created_at", "updated_at")}
+
+
+def test_state_bits_round_trip(random_states):
+    for game in random_states:
+        state = game.to_dict()
+        # 메타데이터는 같은 게임의 초기 상태에서 가져옴 (이름, 모드, 목표 행)
+        base_state = GameState(game_id=game.game_id).to_dict()
+        data = GameSerializer.state_to_bits(state)
+        assert len(data) == 9 + len(state["walls"])
+        restored = GameSerializer.state_from_bits(data, base_state)
+        assert _without_timestamps(restored) == _without_timestamps(state)
+
+
+def test_state_bits_round_trip_finished_game():
+    game = GameState(game_id="finished")
+    game.player2.position = Position(7, 0)
+    game.current_turn = 2
+    assert game.move_pawn(8, 0)[0]
+    state = game.to_dict()
+    assert state["winner"] == 2 and state["status"] == "player2_win"
+
+    restored = GameSerializer.state_from_bits(
+        GameSerializer.state_to_bits(state), GameState(game_id="finished").to_dict()
+    )
+    assert _without_timestamps(restored) == _without_timestamps(state)
+
+
+def test_state_from_bits_restores_game(random_states):
+    # 복원한 딕셔너리로 GameState를 다시 만들 수 있어야 함 (리플레이 재생 경로)
+    game = random_states[-1]
+    restored = GameState.from_dict(GameSerializer.state_from_bits(
+        GameSerializer.state_to_bits(game.to_dict()), GameState(game_id=game.game_id).to_dict()
+    ))
+    assert restored.zobrist_key == game.zobrist_key
+    assert restored.get_valid_pawn_moves() == game.get_valid_pawn_moves()
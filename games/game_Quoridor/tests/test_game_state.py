@@ -0,0 +1,84 @@
+"""
+GameState / SimpleAI 테스트 (상태 복사, 직렬화, 해시 키, AI 수 유효성)
+"""
+
+import pytest
+
+from ..ai.simple_ai import SimpleAI, search_from_snapshot
+from ..core.game_state import GameState, ActionType, FINISHED_STATUSES
+
+
+def _is_legal(game: GameState, action) -> bool:
+    """액션을 상태 복사본에 적용해 유효한지 확인 (원본은 변경하지 않음)"""
+    state = game.copy()
+    if action.action_type == ActionType.MOVE:
+        return state.move_pawn(action.row, action.col)[0]
+    return state.place_wall(action.row, action.col, action.orientation.value)[0]
+
+
+def test_zobrist_key_matches_recomputed(random_states):
+    # 수마다 증분 갱신한 키가 처음부터 계산한 키와 같은지 확인
+    for game in random_states:
+        assert GameState.from_dict(game.to_dict()).zobrist_key == game.zobrist_key
+
+
+def test_to_dict_round_trip(random_states):
+    for game in random_states[::3]:
+        assert GameState.from_dict(game.to_dict()).to_dict() == game.to_dict()
+
+
+def test_copy_is_independent():
+    game = GameState()
+    snapshot = game.to_dict()
+    copied = game.copy()
+    assert copied.place_wall(3, 3, "horizontal")[0]
+    assert copied.move_pawn(1, 4)[0]
+    assert game.to_dict() == snapshot
+    assert game.wall_manager.walls == []
+    assert game.get_valid_wall_placements() != copied.get_valid_wall_placements()
+
+
+def test_to_dict_cache_invalidated_on_change():
+    game = GameState()
+    before = game.to_dict()
+    assert game.move_pawn(7, 4)[0]
+    after = game.to_dict()
+    assert after is not before
+    assert after["players"]["player1"]["position"] == {"row": 7, "col": 4}
+    assert before["players"]["player1"]["position"] == {"row": 8, "col": 4}
+
+
+@pytest.mark.parametrize("difficulty", ["easy", "normal", "hard"])
+def test_ai_returns_legal_action(random_states, difficulty):
+    ai = SimpleAI(difficulty=difficulty)
+    ai.time_limit = 0.2
+    candidates = [
+        game for game in random_states[::23]
+        if game.status not in FINISHED_STATUSES
+    ]
+    for game in candidates:
+        action = ai.get_move(game.copy())
+        assert action is not None
+        assert _is_legal(game, action)
+
+
+def test_ai_plays_full_game():
+    # AI끼리 끝까지 두어 모든 수가 유효하고 게임이 끝나는지 확인
+    game = GameState()
+    ai = SimpleAI(difficulty="normal")
+    ai.time_limit = 0.05
+    while game.status not in FINISHED_STATUSES and game.turn_count < 200:
+        action = ai.get_move(game)
+        assert action is not None and _is_legal(game, action)
+        if action.action_type == ActionType.MOVE:
+            game.move_pawn(action.row, action.col)
+        else:
+            game.place_wall(action.row, action.col, action.orientation.value)
+    assert game.status in FINISHED_STATUSES
+
+
+def test_search_from_snapshot():
+    game = GameState()
+    assert game.move_pawn(7, 4)[0]
+    action = search_from_snapshot("easy", game.to_dict())
+    assert _is_legal(game, action)
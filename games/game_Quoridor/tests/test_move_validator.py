@@ -0,0 +1,137 @@
+"""
+MoveValidator 테스트 (폰 이동, 점프, 벽 설치 규칙)
+"""
+
+from ..core.board import Position
+from ..core.game_state import GameState
+from ..core.move_validator import MoveValidator
+from ..core.wall import Wall, Orientation, ALL_WALLS
+
+
+def _game(p1: tuple[int, int], p2: tuple[int, int], walls=(), turn: int = 1) -> GameState:
+    """폰 위치와 벽을 직접 지정한 게임 상태"""
+    game = GameState()
+    game.player1.position = Position(*p1)
+    game.player2.position = Position(*p2)
+    for row, col, orientation in walls:
+        assert game.wall_manager.add_wall(Wall(row, col, Orientation(orientation)))
+    game.current_turn = turn
+    return game
+
+
+def _moves(game: GameState) -> set[tuple[int, int]]:
+    return {position.to_tuple() for position in game.get_valid_pawn_moves()}
+
+
+# ===== 폰 이동 =====
+
+def test_initial_pawn_moves():
+    game = GameState()
+    assert _moves(game) == {(7, 4), (8, 3), (8, 5)}
+
+
+def test_wall_blocks_pawn_move():
+    # (7, 4) 수평 벽은 (7, 4)-(8, 4), (7, 5)-(8, 5) 이동을 막음
+    game = _game((8, 4), (0, 4), walls=[(7, 4, "horizontal")])
+    assert _moves(game) == {(8, 3), (8, 5)}
+
+
+def test_straight_jump():
+    game = _game((4, 4), (3, 4))
+    assert _moves(game) == {(5, 4), (4, 3), (4, 5), (2, 4)}
+
+
+def test_diagonal_jump_when_wall_behind_opponent():
+    # 상대 뒤 (2, 4)-(3, 4)가 벽으로 막히면 좌우 대각선으로 점프
+    game = _game((4, 4), (3, 4), walls=[(2, 4, "horizontal")])
+    assert _moves(game) == {(5, 4), (4, 3), (4, 5), (3, 3), (3, 5)}
+
+
+def test_diagonal_jump_at_board_edge():
+    game = _game((1, 4), (0, 4))
+    assert _moves(game) == {(2, 4), (1, 3), (1, 5), (0, 3), (0, 5)}
+
+
+def test_diagonal_jump_blocked_side():
+    # 대각선 한쪽 (3, 4)-(3, 5)도 수직 벽으로 막힘
+    game = _game((4, 4), (3, 4), walls=[(2, 4, "horizontal"), (3, 4, "vertical")])
+    assert _moves(game) == {(5, 4), (4, 3), (3, 3)}
+    assert not MoveValidator.is_valid_pawn_move(
+        game.player1, game.player2, Position(3, 5), game.wall_manager
+    )
+
+
+def test_move_pawn_rejects_invalid_target():
+    game = GameState()
+    assert game.move_pawn(6, 4) == (False, "Invalid move")
+    assert game.move_pawn(9, 4)[0] is False
+    assert game.current_turn == 1 and game.turn_count == 0
+
+
+def test_move_pawn_win():
+    game = _game((1, 0), (8, 8))
+    ok, _ = game.move_pawn(0, 0)
+    assert ok
+    assert game.winner == 1
+    assert game.status.value == "player1_win"
+    assert game.move_pawn(1, 0) == (False, "Game is already finished")
+
+
+# ===== 벽 설치 =====
+
+def test_overlapping_wall_rejected():
+    game = GameState()
+    assert game.place_wall(3, 3, "horizontal")[0]
+    # 플레이어 2 차례: 같은 슬롯 (3, 4, h)을 쓰는 벽은 불가, 바로 옆은 가능
+    assert game.place_wall(3, 4, "horizontal") == (False, "Invalid wall placement")
+    assert game.place_wall(3, 2, "horizontal") == (False, "Invalid wall placement")
+    assert game.place_wall(3, 5, "horizontal")[0]
+
+
+def test_crossing_wall_rejected():
+    game = GameState()
+    assert game.place_wall(3, 3, "horizontal")[0]
+    assert game.place_wall(3, 3, "vertical") == (False, "Invalid wall placement")
+    assert game.place_wall(3, 4, "vertical")[0]
+
+
+def test_path_blocking_wall_rejected():
+    # 플레이어 2 (0, 4)를 0행에 가두는 벽 (마지막 출구 (0, 7)-(0, 8)과 (1, 7)-(1, 8))
+    game = _game(
+        (8, 4), (0, 4),
+        walls=[(0, 0, "horizontal"), (0, 2, "horizontal"), (0, 4, "horizontal"), (0, 6, "horizontal")]
+    )
+    blocking = Wall(0, 7, Orientation.VERTICAL)
+    assert not MoveValidator.is_valid_wall_placement(
+        blocking, game.player1, game.player2, game.wall_manager
+    )
+    assert blocking not in game.get_valid_wall_placements()
+    assert game.place_wall(0, 7, "vertical") == (False, "Invalid wall placement")
+    assert game.player1.walls_remaining == 10
+
+
+def test_no_walls_remaining():
+    game = GameState()
+    game.player1.walls_remaining = 0
+    assert game.get_valid_wall_placements() == []
+    assert game.place_wall(3, 3, "horizontal") == (False, "No walls remaining")
+
+
+def test_invalid_wall_parameters():
+    game = GameState()
+    assert game.place_wall(8, 0, "horizontal")[0] is False
+    assert game.place_wall(0, 0, "diagonal")[0] is False
+
+
+def test_valid_wall_placements_match_full_check(random_states):
+    # 최단 경로와 겹치는 벽만 BFS 검사하는 최적화가 전수 검사와 같은 결과인지 확인
+    for game in random_states[::7]:
+        if not game.current_player.has_walls():
+            continue
+        expected = [
+            wall for wall in ALL_WALLS
+            if MoveValidator.is_valid_wall_placement(
+                wall, game.current_player, game.opponent_player, game.wall_manager
+            )
+        ]
+        assert game.get_valid_wall_placements() == expected
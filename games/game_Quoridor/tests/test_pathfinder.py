@@ -0,0 +1,65 @@
+"""
+Pathfinder 테스트 (BFS 경로 / 비트보드 거리 / 거리 필드)
+"""
+
+from ..core.board import Position
+from ..core.pathfinder import Pathfinder
+from ..core.wall import Wall, WallManager, Orientation
+
+
+def _sealed_top_row() -> WallManager:
+    """0행과 1행 사이를 모두 막은 벽 관리자 (경로 검사 없이 직접 설치)"""
+    wall_manager = WallManager()
+    for col in (0, 2, 4, 6):
+        assert wall_manager.add_wall(Wall(0, col, Orientation.HORIZONTAL))
+    assert wall_manager.add_wall(Wall(0, 7, Orientation.VERTICAL))
+    return wall_manager
+
+
+def test_initial_distances(bitboard_backend):
+    wall_manager = WallManager()
+    assert Pathfinder.get_shortest_distance(Position(8, 4), 0, wall_manager) == 8
+    assert Pathfinder.get_shortest_distance(Position(0, 4), 8, wall_manager) == 8
+    assert Pathfinder.get_shortest_distance(Position(0, 4), 0, wall_manager) == 0
+
+
+def test_detour_around_wall(bitboard_backend):
+    # (7, 4) 수평 벽: (8, 4)에서 바로 위로 못 가므로 옆으로 한 칸 돌아감
+    wall_manager = WallManager()
+    wall_manager.add_wall(Wall(7, 4, Orientation.HORIZONTAL))
+    assert Pathfinder.get_shortest_distance(Position(8, 4), 0, wall_manager) == 9
+    path = Pathfinder.find_shortest_path(Position(8, 4), 0, wall_manager)
+    assert len(path) == 10
+    assert path[0] == Position(8, 4) and path[-1].row == 0
+
+
+def test_unreachable_goal(bitboard_backend):
+    wall_manager = _sealed_top_row()
+    # 0행 (0, 0)~(0, 7)은 아래로 내려갈 수 없음, (0, 8)은 가능
+    assert Pathfinder.get_shortest_distance(Position(0, 4), 8, wall_manager) == -1
+    assert not Pathfinder.has_path_to_goal(Position(0, 4), 8, wall_manager)
+    assert Pathfinder.find_shortest_path(Position(0, 4), 8, wall_manager) is None
+    assert Pathfinder.get_shortest_distance(Position(0, 8), 8, wall_manager) == 8
+
+    field = Pathfinder.get_distance_field(8, wall_manager.block_masks)
+    assert field[0 * 9 + 4] == -1
+    assert field[0 * 9 + 8] == 8
+
+
+def test_distances_agree(random_states, bitboard_backend):
+    # 경로 BFS, 비트보드 BFS, 거리 필드가 모든 국면 / 셀에서 같은 거리를 내는지 확인
+    for game in random_states[::5]:
+        wall_manager = game.wall_manager
+        for goal_row in (0, 8):
+            field = Pathfinder.get_distance_field(goal_row, wall_manager.block_masks)
+            assert game.compute_dist_field(goal_row) == field
+            for cell in range(0, 81, 4):
+                start = Position(cell // 9, cell % 9)
+                path = Pathfinder.find_shortest_path(start, goal_row, wall_manager)
+                distance = Pathfinder.get_shortest_distance(start, goal_row, wall_manager)
+                assert distance == (len(path) - 1 if path else -1)
+                assert field[cell] == distance
+        for player_id in (1, 2):
+            player = game.player1 if player_id == 1 else game.player2
+            field = game.compute_dist_field(player.goal_row)
+            assert game.get_player_distance_to_goal(player_id) == field[player.position.row * 9 + player.position.col]